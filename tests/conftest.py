@@ -13,15 +13,28 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 
 
+@pytest.fixture(autouse=True)
+def _close_cached_connections() -> Generator[None, None, None]:
+    """Drop cached database connections so each test starts clean."""
+    yield
+    import database
+
+    database.close_connections()
+
+
 @pytest.fixture
 def temp_db_path() -> Generator[Path, None, None]:
     """Create a temporary database file for testing."""
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         temp_path = Path(f.name)
     yield temp_path
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    # Cleanup: release cached connections first so WAL sidecars are removed
+    import database
+
+    database.close_connections()
+    for path in (temp_path, Path(f"{temp_path}-wal"), Path(f"{temp_path}-shm")):
+        if path.exists():
+            path.unlink()
 
 
 @pytest.fixture
@@ -0,0 +1,76 @@
+"""
+Tests for centralized configuration (tools/config.py).
+"""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR))
+
+
+def _load_fresh_config(name="config_under_test"):
+    """Import tools/config.py as a new module so env changes take effect."""
+    spec = importlib.util.spec_from_file_location(name, TOOLS_DIR / "config.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestLazySettings:
+    """API_* / SECURITY_* settings are parsed on first access."""
+
+    def test_not_parsed_at_import(self):
+        cfg = _load_fresh_config()
+        assert "API_ALLOW_ORIGINS" not in vars(cfg)
+        assert "SECURITY_CONTENT_SECURITY_POLICY" not in vars(cfg)
+
+    def test_first_access_caches_global(self):
+        cfg = _load_fresh_config()
+        origins = cfg.API_ALLOW_ORIGINS
+        assert origins == ("http://localhost:8000", "http://127.0.0.1:8000")
+        assert vars(cfg)["API_ALLOW_ORIGINS"] is origins
+
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv("API_RATE_LIMIT_PER_MINUTE", "7")
+        monkeypatch.setenv("SECURITY_ALLOW_UNSAFE_EVAL", "yes")
+        cfg = _load_fresh_config()
+        assert cfg.API_RATE_LIMIT_PER_MINUTE == 7
+        assert "'unsafe-eval'" in cfg.SECURITY_CONTENT_SECURITY_POLICY
+
+    def test_from_import(self):
+        from config import API_MAX_REQUEST_BYTES, SECURITY_FRAME_OPTIONS
+
+        assert API_MAX_REQUEST_BYTES == 1024 * 1024
+        assert SECURITY_FRAME_OPTIONS == "DENY"
+
+    def test_unknown_attribute(self):
+        cfg = _load_fresh_config()
+        with pytest.raises(AttributeError):
+            cfg.API_DOES_NOT_EXIST
+
+    def test_dir_lists_lazy_settings(self):
+        cfg = _load_fresh_config()
+        names = dir(cfg)
+        assert "API_TRUSTED_PROXIES" in names
+        assert "DB_PATH" in names
+
+
+class TestSetupLogging:
+    """setup_logging builds each logger once but always applies the level."""
+
+    def test_level_reapplied_on_repeat_calls(self):
+        from config import setup_logging
+
+        logger = setup_logging("wkbl.test_setup_logging")
+        logger.setLevel(logging.DEBUG)
+        assert setup_logging("wkbl.test_setup_logging") is logger
+        assert logger.level == logging.INFO
+        assert setup_logging("wkbl.test_setup_logging", logging.WARNING).level == (
+            logging.WARNING
+        )
+        assert len(logger.handlers) == 1
@@ -2,9 +2,11 @@
 Tests for database.py - SQLite database operations.
 """
 
+import sqlite3
 import sys
 from pathlib import Path
 
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 
@@ -68,6 +70,39 @@ class TestDatabaseInit:
 
         assert "is_exhibition" in columns
 
+    def test_init_db_drops_boxscore_created_at(self, test_db):
+        """Legacy created_at columns are removed from the box-score tables."""
+        import database
+
+        with database.get_connection() as conn:
+            conn.execute("ALTER TABLE player_games ADD COLUMN created_at TEXT")
+            conn.commit()
+        database.init_db()
+
+        with database.get_connection() as conn:
+            for table in ("player_games", "team_games"):
+                info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+                assert "created_at" not in {row[1] for row in info}
+
+    def test_init_db_skips_drop_when_column_absent(self, test_db, monkeypatch):
+        """Re-running init_db does not attempt to drop missing columns."""
+        import database
+
+        statements = []
+
+        class RecordingCursor(sqlite3.Cursor):
+            def execute(self, sql, *args):
+                statements.append(sql)
+                return super().execute(sql, *args)
+
+        def cursor(conn, factory=RecordingCursor):
+            return sqlite3.Connection.cursor(conn, factory)
+
+        monkeypatch.setattr(database._Connection, "cursor", cursor)
+        database.init_db()
+        assert statements
+        assert not [sql for sql in statements if "DROP COLUMN" in sql]
+
     def test_init_db_is_idempotent(self, test_db):
         """Test that init_db can be called multiple times without error."""
         import database
@@ -76,6 +111,28 @@ class TestDatabaseInit:
         database.init_db()
         database.init_db()
 
+    def test_init_db_skips_seeded_master_data(self, test_db, monkeypatch):
+        """Master data and descriptions are only rewritten when out of date."""
+        import database
+
+        heads = []
+        real_insert = database._insert_value_rows
+
+        def record(conn, head, rows):
+            heads.append(head.split()[4])
+            real_insert(conn, head, rows)
+
+        monkeypatch.setattr(database, "_insert_value_rows", record)
+        database.init_db()
+        assert not {"teams", "event_types", "_meta_descriptions"} & set(heads)
+
+        with database.get_connection() as conn:
+            conn.execute("DELETE FROM event_types WHERE rowid = 1")
+            conn.execute("UPDATE _meta_descriptions SET description = 'stale'")
+            conn.commit()
+        database.init_db()
+        assert "event_types" in heads and "_meta_descriptions" in heads
+
     def test_init_db_creates_performance_indexes(self, test_db):
         """Test that composite indexes for season/team roster queries are created."""
         import database
@@ -89,11 +146,272 @@ class TestDatabaseInit:
             "idx_player_games_team_game",
             "idx_player_games_player_game",
             "idx_games_season_date_id",
+            "idx_team_games_team_game",
+            "idx_games_season_scored",
+            "idx_players_team",
         }
         assert expected_indexes.issubset(indexes), (
             f"Missing indexes: {expected_indexes - indexes}"
         )
 
+    def test_existing_game_ids_use_covering_index(self, test_db):
+        """The scored-games lookup is answered from the index alone."""
+        import database
+
+        with database.get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN "
+                "SELECT id FROM games WHERE season_id = ? AND home_score IS NOT NULL",
+                ("046",),
+            ).fetchall()
+        assert "COVERING INDEX idx_games_season_scored" in plan[0][3]
+
+    def test_init_db_collects_planner_statistics(self, test_db):
+        """init_db leaves sqlite_stat1 behind for the query planner."""
+        import database
+
+        database.init_db()  # second run takes the PRAGMA optimize path
+        with database.get_connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+        assert row is not None
+
+
+class TestConnectionCache:
+    """Tests for the per-thread cached connection behind get_connection."""
+
+    def test_connection_reused_across_calls(self, test_db):
+        import database
+
+        with database.get_connection() as first:
+            pass
+        with database.get_connection() as second:
+            pass
+        assert first is second
+
+    def test_nested_blocks_share_connection(self, test_db):
+        import database
+
+        with database.get_connection() as outer:
+            with database.get_connection() as inner:
+                assert inner is outer
+
+    def test_uncommitted_writes_rolled_back_on_exit(self, test_db):
+        import database
+
+        with database.get_connection() as conn:
+            conn.execute("INSERT INTO seasons (id, label) VALUES ('999', 'x')")
+            with database.get_connection():
+                pass
+            assert conn.in_transaction
+
+        with database.get_connection() as conn:
+            row = conn.execute("SELECT 1 FROM seasons WHERE id = '999'").fetchone()
+        assert row is None
+
+    def test_thread_connections_closed_on_thread_exit(self, test_db):
+        import gc
+        import threading
+
+        import database
+
+        def open_count():
+            with database._connections_lock:
+                return sum(map(len, database._all_connections.values()))
+
+        database.close_connections()
+        baseline = open_count()
+
+        opened = []
+
+        def worker():
+            with database.get_connection() as conn:
+                conn.execute("SELECT 1").fetchone()
+                opened.append(conn)
+
+        for _ in range(20):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert len(opened) == 20
+        assert open_count() == baseline == 0
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+        # Only exited threads used the file; it still leaves WAL mode.
+        database.close_connections()
+        assert Path(test_db).read_bytes()[18:20] == bytes([1, 1])
+
+    def test_close_connections_owns_exited_threads_connections(
+        self, test_db, monkeypatch
+    ):
+        """A finished thread's finalizer never closes a connection that
+        close_connections() has already taken."""
+        import gc
+        import threading
+
+        import database
+
+        database.close_connections()
+        held = []
+
+        def worker():
+            with database.get_connection() as conn:
+                conn.execute("SELECT 1").fetchone()
+            # Keep the thread's cache (and its finalizer) alive past exit.
+            held.append(database._local.connections)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        closed_mid_checkpoint = []
+        real_execute = database._Connection.execute
+
+        def execute(conn, sql, *args):
+            if sql.startswith("PRAGMA wal_checkpoint"):
+                held.clear()  # the exited thread's finalizer runs now
+                gc.collect()
+                try:
+                    real_execute(conn, "SELECT 1")
+                except sqlite3.ProgrammingError:
+                    closed_mid_checkpoint.append(conn)
+            return real_execute(conn, sql, *args)
+
+        monkeypatch.setattr(database._Connection, "execute", execute)
+        database.close_connections()
+
+        assert closed_mid_checkpoint == []
+        assert Path(test_db).read_bytes()[18:20] == bytes([1, 1])
+
+    def test_close_connections_forces_reconnect(self, test_db):
+        import database
+
+        with database.get_connection() as first:
+            pass
+        database.close_connections()
+        with database.get_connection() as second:
+            assert second is not first
+            assert second.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_connection_pragmas(self, test_db):
+        import database
+
+        with database.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+
+    def test_bulk_load_relaxes_synchronous(self, test_db):
+        import database
+
+        with database.bulk_load() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+        with database.get_connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_bulk_load_still_rolls_back_failed_writes(self, populated_db, sample_game):
+        import database
+
+        game_id = sample_game["game_id"]
+        records = [
+            {"game_id": game_id, "home_q1": 99},
+            {"game_id": game_id, "home_q1": object()},
+        ]
+        with database.bulk_load():
+            with pytest.raises(sqlite3.ProgrammingError):
+                database.bulk_update_quarter_scores(records)
+            # A later helper's commit must not persist the failed batch.
+            database.insert_season("047", "2026-27")
+
+        with database.get_connection() as conn:
+            row = conn.execute(
+                "SELECT home_q1 FROM games WHERE id = ?", (game_id,)
+            ).fetchone()
+        assert row[0] != 99
+
+    def test_close_restores_rollback_journal(self, test_db):
+        import database
+
+        database.insert_season("046", "2025-26")
+        database.close_connections()
+        header = Path(test_db).read_bytes()[:20]
+        # File format read/write versions: 1 = rollback journal, 2 = WAL
+        assert header[18:20] == bytes([1, 1])
+        assert not Path(f"{test_db}-wal").exists()
+
+    def test_separate_connection_per_path(self, test_db, tmp_path, monkeypatch):
+        import database
+
+        with database.get_connection() as first:
+            pass
+        monkeypatch.setattr(database, "DB_PATH", tmp_path / "other.db")
+        with database.get_connection() as second:
+            assert second is not first
+
+
+class TestWriteBatch:
+    """Tests for write_batch group commits."""
+
+    def _season_visible(self, db_path):
+        with sqlite3.connect(db_path) as other:
+            row = other.execute("SELECT 1 FROM seasons WHERE id = '046'").fetchone()
+        return row is not None
+
+    def test_commits_once_on_exit(self, test_db):
+        import database
+
+        with database.write_batch():
+            with database.write_batch():
+                database.insert_season("046", "2025-26")
+            assert not self._season_visible(test_db)
+        assert self._season_visible(test_db)
+
+    def test_takes_write_lock_up_front(self, test_db):
+        import database
+
+        with database.write_batch() as conn:
+            assert conn.in_transaction
+            other = sqlite3.connect(test_db, timeout=0)
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("BEGIN IMMEDIATE")
+            other.close()
+
+    def test_readers_on_other_threads_are_not_blocked(self, test_db):
+        import threading
+
+        import database
+
+        def read_labels():
+            with database.get_connection() as conn:
+                seen.extend(r[0] for r in conn.execute("SELECT label FROM seasons"))
+
+        database.insert_season("046", "2025-26")
+        seen = []
+        with database.write_batch():
+            database.insert_season("047", "2026-27")
+            reader = threading.Thread(target=read_labels)
+            reader.start()
+            reader.join(timeout=1)
+            assert not reader.is_alive()
+        assert seen == ["2025-26"]
+
+    def test_rolls_back_on_error(self, test_db):
+        import database
+
+        with pytest.raises(RuntimeError):
+            with database.write_batch():
+                database.insert_season("046", "2025-26")
+                raise RuntimeError("boom")
+        assert not self._season_visible(test_db)
+        database.insert_season("046", "2025-26")
+        assert self._season_visible(test_db)
+
 
 class TestSeasonOperations:
     """Tests for season-related database operations."""
@@ -306,6 +624,7 @@ class TestGameOperations:
         import database
 
         game_ids = database.get_existing_game_ids()
+        assert isinstance(game_ids, frozenset)
         assert sample_game["game_id"] in game_ids
 
     def test_get_existing_game_ids_by_season(
@@ -342,6 +661,25 @@ class TestPlayerGameOperations:
         assert row[1] == sample_player_game["stats"]["reb"]
         assert row[2] == sample_player_game["stats"]["ast"]
 
+    def test_reinsert_player_game_updates_in_place(
+        self, populated_db, sample_player_game
+    ):
+        """Re-ingesting a row updates it without allocating a new id."""
+        import database
+
+        key = (sample_player_game["game_id"], sample_player_game["player_id"])
+        query = "SELECT id, pts FROM player_games WHERE game_id = ? AND player_id = ?"
+        with database.get_connection() as conn:
+            before = conn.execute(query, key).fetchone()
+
+        stats = dict(sample_player_game["stats"], pts=31)
+        row_id = database.insert_player_game(**{**sample_player_game, "stats": stats})
+        with database.get_connection() as conn:
+            after = conn.execute(query, key).fetchone()
+
+        assert after["id"] == before["id"] == row_id
+        assert after["pts"] == 31
+
     def test_bulk_insert_player_games(
         self,
         test_db,
@@ -409,6 +747,68 @@ class TestPlayerGameOperations:
         assert row is not None
         assert row[0] == 15
 
+    def test_bulk_insert_player_games_rebuilds_indexes(self, test_db, monkeypatch):
+        """Large batches drop and recreate the secondary indexes."""
+        import database
+
+        monkeypatch.setattr(database, "_INDEX_REBUILD_MIN_ROWS", 1)
+        stat_keys = (
+            "minutes pts off_reb def_reb reb ast stl blk tov pf "
+            "fgm fga tpm tpa ftm fta two_pm two_pa"
+        ).split()
+        records = [
+            {"game_id": "G1", "player_id": pid, "team_id": "kb"}
+            | dict.fromkeys(stat_keys, 1)
+            for pid in ("P1", "P2", "P3")
+        ]
+        database.bulk_insert_player_games(records)
+
+        with database.get_connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM player_games").fetchone()[0]
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='index' AND tbl_name='player_games'"
+                )
+            }
+            analyzed = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT idx FROM sqlite_stat1 WHERE tbl = 'player_games'"
+                )
+            }
+        assert count == 3
+        assert set(database._PLAYER_GAMES_INDEXES) <= indexes
+        assert set(database._PLAYER_GAMES_INDEXES) <= analyzed
+
+    def test_bulk_insert_player_games_chunks_statements(self, test_db, monkeypatch):
+        """Batches larger than one statement's parameter budget are split."""
+        import database
+
+        # Two 21-column rows per statement: 5 records -> 2 full + 1 tail
+        monkeypatch.setattr(database, "_MAX_SQL_VARIABLES", 42)
+        records = [
+            dict.fromkeys(database._PLAYER_GAMES_COLUMNS, 0)
+            | {"game_id": "G1", "player_id": f"P{i}", "pts": i}
+            for i in range(5)
+        ]
+        database.bulk_insert_player_games(records)
+
+        query = "SELECT id, player_id, pts FROM player_games ORDER BY player_id"
+        with database.get_connection() as conn:
+            rows = conn.execute(query).fetchall()
+        assert [tuple(row)[1:] for row in rows] == [(f"P{i}", i) for i in range(5)]
+
+        # Re-loading the batch updates the rows in place.
+        for record in records:
+            record["pts"] += 10
+        database.bulk_insert_player_games(records)
+        with database.get_connection() as conn:
+            reloaded = conn.execute(query).fetchall()
+        assert [row["id"] for row in reloaded] == [row["id"] for row in rows]
+        assert [row["pts"] for row in reloaded] == [i + 10 for i in range(5)]
+
 
 class TestSeasonStats:
     """Tests for season statistics queries."""
@@ -429,6 +829,107 @@ class TestSeasonStats:
         assert player_stats["pts"] == 18.0  # From sample_player_game
         assert player_stats["gp"] == 1
 
+    def test_iter_all_season_stats_is_lazy(self, populated_db, sample_season):
+        """The iterator yields the same rows as the list helper."""
+        import database
+
+        season_id = sample_season["season_id"]
+        rows = database.iter_all_season_stats(season_id)
+        assert not isinstance(rows, list)
+        assert list(rows) == database.get_all_season_stats(season_id)
+
+    def test_season_summary_refreshed_after_writes(
+        self, populated_db, sample_season, sample_player, sample_player_game
+    ):
+        """Writes to player_games mark the season stale until it is re-read."""
+        import database
+
+        season_id = sample_season["season_id"]
+        database.get_all_season_stats(season_id)
+        with database.get_connection() as conn:
+            stale = conn.execute(
+                "SELECT season_id FROM player_season_summary_stale"
+            ).fetchall()
+        assert stale == []
+
+        stats = dict(sample_player_game["stats"], pts=30)
+        database.insert_player_game(**{**sample_player_game, "stats": stats})
+        with database.get_connection() as conn:
+            stale = conn.execute(
+                "SELECT season_id FROM player_season_summary_stale"
+            ).fetchall()
+        assert [row[0] for row in stale] == [season_id]
+
+        rows = database.get_all_season_stats(season_id)
+        player = next(r for r in rows if r["id"] == sample_player["player_id"])
+        assert player["pts"] == 30.0
+        assert player["total_pts"] == 30
+
+    def test_refresh_player_season_summary(self, populated_db, sample_season):
+        """Explicit refresh rebuilds every stale season."""
+        import database
+
+        assert database.refresh_player_season_summary() == 1
+        assert database.refresh_player_season_summary() == 0
+        with database.get_connection() as conn:
+            count = conn.execute(
+                "SELECT COUNT(*) FROM player_season_summary WHERE season_id = ?",
+                (sample_season["season_id"],),
+            ).fetchone()[0]
+        assert count == 1
+
+    def test_all_season_stats_falls_back_when_refresh_fails(
+        self, populated_db, sample_season, sample_player, monkeypatch
+    ):
+        """If the summary cannot be rebuilt, player_games is aggregated live."""
+        import sqlite3
+
+        import database
+
+        def fail(conn, season_id):
+            raise sqlite3.OperationalError("attempt to write a readonly database")
+
+        monkeypatch.setattr(database, "_refresh_season_summary", fail)
+        rows = database.get_all_season_stats(sample_season["season_id"])
+        assert [r["id"] for r in rows] == [sample_player["player_id"]]
+        assert rows[0]["pts"] == 18.0
+
+    def test_stale_season_read_inside_write_batch(
+        self,
+        populated_db,
+        sample_season,
+        sample_player,
+        sample_player_game,
+        monkeypatch,
+    ):
+        """A stale read inside a batch aggregates live and leaves the batch's
+        earlier writes alone."""
+        import database
+
+        refreshes = []
+
+        def fail(conn, season_id):
+            refreshes.append(season_id)
+            raise sqlite3.OperationalError("attempt to write a readonly database")
+
+        monkeypatch.setattr(database, "_refresh_season_summary", fail)
+        season_id = sample_season["season_id"]
+        with database.write_batch():
+            database.insert_season("047", "2026-27")
+            stats = dict(sample_player_game["stats"], pts=30)
+            database.insert_player_game(**{**sample_player_game, "stats": stats})
+            rows = list(database.iter_all_season_stats(season_id))
+
+        assert refreshes == []
+        assert rows[0]["id"] == sample_player["player_id"]
+        assert rows[0]["pts"] == 30.0
+        with database.get_connection() as conn:
+            assert conn.execute("SELECT 1 FROM seasons WHERE id = '047'").fetchone()
+            stale = conn.execute(
+                "SELECT season_id FROM player_season_summary_stale"
+            ).fetchall()
+        assert [row[0] for row in stale] == [season_id]
+
     def test_get_player_season_stats(self, populated_db, sample_player, sample_season):
         """Test getting specific player's season stats."""
         import database
@@ -442,6 +943,36 @@ class TestSeasonStats:
         assert stats["reb"] == 5.0
         assert stats["ast"] == 4.0
 
+    def test_player_season_stats_reflect_writes_and_rollbacks(
+        self, populated_db, sample_player, sample_season, sample_player_game
+    ):
+        """Season stats are read fresh after commits and after rollbacks."""
+        import sqlite3
+
+        import database
+
+        args = (sample_player["player_id"], sample_season["season_id"])
+        assert database.get_player_season_stats(*args)["pts"] == 18.0
+
+        stats = dict(sample_player_game["stats"], pts=30)
+        database.insert_player_game(**{**sample_player_game, "stats": stats})
+        assert database.get_player_season_stats(*args)["pts"] == 30.0
+
+        # A commit from an unrelated connection is seen too.
+        other = sqlite3.connect(populated_db)
+        other.execute("UPDATE player_games SET pts = 12")
+        other.commit()
+        other.close()
+        assert database.get_player_season_stats(*args)["pts"] == 12.0
+
+        # A read taken inside a transaction that rolls back is not kept.
+        with pytest.raises(RuntimeError):
+            with database.write_batch() as conn:
+                conn.execute("UPDATE player_games SET pts = 99")
+                assert database.get_player_season_stats(*args)["pts"] == 99.0
+                raise RuntimeError("abort batch")
+        assert database.get_player_season_stats(*args)["pts"] == 12.0
+
 
 class TestBoxscore:
     """Tests for boxscore functionality."""
@@ -600,6 +1131,10 @@ class TestPredictions:
 
         # Now predictions should exist
         assert database.has_game_predictions(sample_game["game_id"]) is True
+        assert database.get_games_with_predictions(
+            [sample_game["game_id"], "99999999", sample_game["game_id"]]
+        ) == frozenset([sample_game["game_id"]])
+        assert database.get_games_with_predictions([]) == frozenset()
 
     def test_predictions_for_future_game(
         self, test_db, sample_season, sample_team, sample_team2, sample_player
@@ -930,6 +1465,16 @@ class TestBulkTeamStandings:
         team2 = next(s for s in result if s["team_id"] == sample_team2["id"])
         assert team2["rank"] == 2
         assert team2["games_behind"] == 2.0
+        # One batch shares one stamp, in datetime('now') format.
+        assert team1["updated_at"] == team2["updated_at"]
+        assert len(team1["updated_at"]) == len("2026-01-01 00:00:00")
+
+        # Re-loading the season updates the existing rows in place.
+        standings[0]["wins"] = 13
+        database.bulk_insert_team_standings(sample_season["season_id"], standings)
+        reloaded = database.get_team_standings(sample_season["season_id"])
+        assert [s["id"] for s in reloaded] == [s["id"] for s in result]
+        assert reloaded[0]["wins"] == 13
 
 
 class TestQuarterScores:
@@ -996,6 +1541,32 @@ class TestQuarterScores:
         assert row[1] == 18
         assert row[2] == "잠실실내체육관"
 
+    def test_bulk_update_quarter_scores_is_atomic(self, populated_db, sample_game):
+        """A bad record rolls back the rows already written in the batch."""
+        import database
+
+        game_id = sample_game["game_id"]
+        with database.get_connection() as conn:
+            before = conn.execute(
+                "SELECT home_q1 FROM games WHERE id = ?", (game_id,)
+            ).fetchone()[0]
+
+        # The second record fails to bind inside executemany, after the first
+        # UPDATE has already run.
+        records = [
+            {"game_id": game_id, "home_q1": 99},
+            {"game_id": game_id, "home_q1": object()},
+        ]
+        with pytest.raises(sqlite3.ProgrammingError):
+            database.bulk_update_quarter_scores(records)
+
+        with database.get_connection() as conn:
+            row = conn.execute(
+                "SELECT home_q1 FROM games WHERE id = ?", (game_id,)
+            ).fetchone()
+        assert before != 99
+        assert row[0] == before
+
 
 class TestPopulateQuarterScoresFromH2H:
     """Tests for populate_quarter_scores_from_h2h()."""
@@ -1381,6 +1952,11 @@ class TestPlayByPlay:
         assert result[0]["event_order"] == 1
         assert result[0]["quarter"] == "Q1"
 
+        # Streaming variant yields the same rows lazily
+        stream = database.iter_play_by_play(sample_game["game_id"])
+        assert next(stream) == result[0]
+        assert list(stream) == result[1:]
+
     def test_get_play_by_play_quarter_filter(
         self, populated_db, sample_game, sample_team
     ):
@@ -1682,6 +2258,17 @@ class TestMetadataDescriptions:
         descs = database.get_column_descriptions("players")
         assert isinstance(descs, dict)
 
+    def test_season_summary_columns_described(self, populated_db):
+        """Every column of the season summary tables has a description."""
+        import database
+
+        for table in ("player_season_summary", "player_season_summary_stale"):
+            with database.get_connection() as conn:
+                columns = {
+                    row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                }
+            assert set(database.get_column_descriptions(table)) == columns
+
     def test_get_column_descriptions_empty(self, populated_db):
         """Test getting column descriptions for table with none."""
         import database
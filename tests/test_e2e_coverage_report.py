@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 
 import pytest
+import yaml
 
 import e2e_coverage_report as report
 
@@ -436,3 +437,10 @@ def test_main_end_to_end_and_failure_modes(
         (tmp_path / "reports/out-all.json").read_text(encoding="utf-8")
     )
     assert "all" in all_payload["tiers"]
+
+
+def test_load_matrix_rejects_python_tags(tmp_path: Path) -> None:
+    matrix = tmp_path / "tagged.yaml"
+    _write(matrix, "scenarios: !!python/object/apply:os.getcwd []\n")
+    with pytest.raises(yaml.YAMLError):
+        report.load_matrix(matrix)
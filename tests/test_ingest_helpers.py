@@ -1728,7 +1728,8 @@ class TestGeneratePredictionsForGameIds:
                     "away_team_id": "samsung",
                 },
             }
-            mock_db.has_game_predictions.return_value = True
+            mock_db.get_games_with_predictions.return_value = frozenset(["04601010"])
             _generate_predictions_for_game_ids(["04601010"])
 
         mock_gen.assert_not_called()
+        mock_db.get_game_boxscore.assert_not_called()
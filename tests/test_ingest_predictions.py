@@ -151,7 +151,7 @@ def test_backfill_skips_existing_predictions(
     assert preds["team"]["home_predicted_pts"] == team_prediction["home_predicted_pts"]
 
 
-def test_save_future_games_skips_games_on_end_date(monkeypatch):
+def test_save_future_games_skips_games_on_end_date(test_db, monkeypatch):
     import ingest_wkbl
 
     inserted_game_ids = []
@@ -296,6 +296,24 @@ class TestParseShotChart:
         assert get_shot_zone(10, 100) == "three_pt"
         assert get_shot_zone(290, 170) == "three_pt"
 
+    def test_shot_zones_batch_matches_scalar(self):
+        """Batch classification agrees with the scalar helper."""
+        from config import get_shot_zone, get_shot_zones
+
+        xs = [150, 170, 100, 10, 290]
+        ys = [30, 20, 80, 100, 170]
+        assert get_shot_zones(xs, ys) == [get_shot_zone(x, y) for x, y in zip(xs, ys)]
+        assert get_shot_zones([], []) == []
+
+    def test_shot_zone_boundaries(self):
+        """Distances exactly on a threshold keep their original zone."""
+        from config import get_shot_zone
+
+        assert get_shot_zone(150, 60) == "paint"  # 50px from basket
+        assert get_shot_zone(150, 61) == "mid_range"
+        assert get_shot_zone(150, 129) == "mid_range"
+        assert get_shot_zone(150, 130) == "three_pt"  # 120px from basket
+
     def test_empty_html(self):
         """Test parsing empty HTML returns no shots."""
         from ingest_wkbl import parse_shot_chart
@@ -469,6 +487,41 @@ class TestEventTypeMap:
                 f"Missing category for {code} ({kr_name})"
             )
 
+    def test_event_type_full_fuses_code_and_category(self):
+        """EVENT_TYPE_FULL pairs each label with its code and category."""
+        from config import EVENT_TYPE_CATEGORIES, EVENT_TYPE_FULL, EVENT_TYPE_MAP
+
+        assert EVENT_TYPE_FULL.keys() == EVENT_TYPE_MAP.keys()
+        for kr_name, (code, category) in EVENT_TYPE_FULL.items():
+            assert code == EVENT_TYPE_MAP[kr_name]
+            assert category == EVENT_TYPE_CATEGORIES[code]
+
+    def test_event_codes_are_interned(self):
+        """Event codes and categories are interned so comparisons hit identity."""
+        from config import EVENT_TYPE_CATEGORIES, EVENT_TYPE_MAP
+
+        for code in EVENT_TYPE_MAP.values():
+            assert sys.intern(code) is code
+        for code, category in EVENT_TYPE_CATEGORIES.items():
+            assert sys.intern(code) is code
+            assert sys.intern(category) is category
+
+    def test_event_maps_are_read_only(self):
+        """Shared event lookup tables cannot be mutated by callers."""
+        from config import EVENT_TYPE_CATEGORIES, EVENT_TYPE_FULL, EVENT_TYPE_MAP
+
+        for mapping in (EVENT_TYPE_MAP, EVENT_TYPE_CATEGORIES, EVENT_TYPE_FULL):
+            with pytest.raises(TypeError):
+                mapping["new"] = "value"
+
+    def test_match_order_is_longest_label_first(self):
+        """Precomputed match order covers every label, longest first."""
+        from config import EVENT_TYPE_MAP, EVENT_TYPE_MATCH_ORDER
+
+        assert dict(EVENT_TYPE_MATCH_ORDER) == dict(EVENT_TYPE_MAP)
+        lengths = [len(kr_name) for kr_name, _ in EVENT_TYPE_MATCH_ORDER]
+        assert lengths == sorted(lengths, reverse=True)
+
     def test_event_types_populated_in_db(self, test_db):
         """Test that event_types table is populated on init."""
         import database
@@ -214,3 +214,36 @@ class TestSplitDatabase:
         assert result["core_tables"] == ["seasons"]
         assert result["detail_tables"] == []
         assert _get_tables(detail) == []
+
+
+class TestSplitWalSource:
+    def test_wal_source_is_published_in_rollback_mode(self, sample_db, tmp_path):
+        conn = sqlite3.connect(sample_db)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("INSERT INTO players VALUES ('003', '선수C')")
+        conn.commit()
+        conn.close()
+
+        core = str(tmp_path / "core.db")
+        detail = str(tmp_path / "detail.db")
+        split_database(sample_db, core, detail)
+
+        for path in (sample_db, core, detail):
+            # File format read/write versions: 1 = rollback journal, 2 = WAL
+            with open(path, "rb") as f:
+                assert f.read(20)[18:20] == bytes([1, 1])
+        conn = sqlite3.connect(core)
+        assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 3
+        conn.close()
+
+    def test_source_open_elsewhere_raises(self, sample_db, tmp_path):
+        reader = sqlite3.connect(sample_db)
+        reader.execute("PRAGMA journal_mode=WAL")
+        reader.execute("SELECT COUNT(*) FROM players").fetchone()
+        try:
+            with pytest.raises(RuntimeError, match="still open"):
+                split_database(
+                    sample_db, str(tmp_path / "core.db"), str(tmp_path / "detail.db")
+                )
+        finally:
+            reader.close()
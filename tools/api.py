@@ -11,7 +11,7 @@ import hashlib
 import ipaddress
 import time
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -60,7 +60,9 @@ class _PayloadTooLargeError(Exception):
 IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
 
 
-def _compile_trusted_proxies(raw_items: list[str]) -> tuple[list[IPNetwork], set[str]]:
+def _compile_trusted_proxies(
+    raw_items: Sequence[str],
+) -> tuple[list[IPNetwork], set[str]]:
     networks: list[IPNetwork] = []
     literals: set[str] = set()
     for item in raw_items:
@@ -3,31 +3,45 @@
 
 import logging
 import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+# Snapshot of the process environment, read once at import.
+_ENV = dict(os.environ)
+
+
+_TRUE_SET = frozenset(("1", "true", "yes", "on"))
 
 
 def _parse_bool_env(name: str, default: bool) -> bool:
-    raw = os.getenv(name)
+    raw = _ENV.get(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in _TRUE_SET
+
 
+def _parse_int_env(name: str, default: int) -> int:
+    return int(_ENV.get(name, default))
 
-def _parse_csv_env(name: str, default: str) -> list[str]:
-    raw = os.getenv(name, default)
-    return [item.strip() for item in raw.split(",") if item.strip()]
+
+def _parse_csv_env(name: str, default: str) -> tuple[str, ...]:
+    raw = _ENV.get(name, default)
+    return tuple(item for item in map(str.strip, raw.split(",")) if item)
 
 
 # URL Constants
 BASE_URL = "https://datalab.wkbl.or.kr"
-PLAYER_RECORD_WRAPPER = BASE_URL + "/playerRecord"
-GAME_LIST_MONTH = BASE_URL + "/game/list/month"
+PLAYER_RECORD_WRAPPER = sys.intern(f"{BASE_URL}/playerRecord")
+GAME_LIST_MONTH = sys.intern(f"{BASE_URL}/game/list/month")
 PLAYER_LIST = "https://www.wkbl.or.kr/player/player_list.asp"
 PLAYER_LIST_RETIRED = "https://www.wkbl.or.kr/player/player_list.asp?player_group=11"
 PLAYER_LIST_FOREIGN = "https://www.wkbl.or.kr/player/player_list.asp?player_group=F11"
 TEAM_STANDINGS_URL = "https://www.wkbl.or.kr/game/ajax/ajax_team_rank.asp"
-PLAY_BY_PLAY_URL = BASE_URL + "/playByPlay"
-SHOT_CHART_URL = BASE_URL + "/shotCharts"
-TEAM_ANALYSIS_URL = BASE_URL + "/teamAnalysis"
+PLAY_BY_PLAY_URL = sys.intern(f"{BASE_URL}/playByPlay")
+SHOT_CHART_URL = sys.intern(f"{BASE_URL}/shotCharts")
+TEAM_ANALYSIS_URL = sys.intern(f"{BASE_URL}/teamAnalysis")
 TEAM_CATEGORY_STATS_URL = "https://www.wkbl.or.kr/game/ajax/ajax_part_team_rank.asp"
 HEAD_TO_HEAD_URL = "https://www.wkbl.or.kr/game/ajax/ajax_report.asp"
 MVP_URL = "https://www.wkbl.or.kr/game/today_mvp.asp"
@@ -41,6 +55,7 @@ WKBL_TEAM_CODES = {
     "hana": "09",
     "bnk": "11",
 }
+WKBL_TEAM_BY_CODE = {code: team_id for team_id, code in WKBL_TEAM_CODES.items()}
 
 # Team category stats part numbers → stat names
 TEAM_CATEGORY_PARTS = {
@@ -58,72 +73,124 @@ TEAM_CATEGORY_PARTS = {
     12: "ftp",
 }
 
-# Play-by-play event type mapping (Korean → English code)
-EVENT_TYPE_MAP = {
-    "2점슛성공": "2pt_made",
-    "2점슛시도": "2pt_miss",
-    "3점슛성공": "3pt_made",
-    "3점슛시도": "3pt_miss",
-    "페인트존2점슛성공": "paint_2pt_made",
-    "자유투성공": "ft_made",
-    "자유투실패": "ft_miss",
-    "공격리바운드": "off_rebound",
-    "수비리바운드": "def_rebound",
-    "팀공격리바운드": "team_off_rebound",
-    "팀수비리바운드": "team_def_rebound",
-    "어시스트": "assist",
-    "스틸": "steal",
-    "블록": "block",
-    "턴오버": "turnover",
-    "팀턴오버": "team_turnover",
-    "파울": "foul",
-    "테크니컬파울": "tech_foul",
-    "교체(IN)": "sub_in",
-    "교체(OUT)": "sub_out",
-    "속공성공": "fastbreak_made",
-    "속공실패": "fastbreak_miss",
-    "굿디펜스": "good_defense",
-    "정규작전타임": "timeout",
-    "UnsportsManLike": "unsportsmanlike_foul",
-}
+# Play-by-play event type mapping (Korean → English code), read-only
+EVENT_TYPE_MAP = MappingProxyType(
+    {
+        "2점슛성공": "2pt_made",
+        "2점슛시도": "2pt_miss",
+        "3점슛성공": "3pt_made",
+        "3점슛시도": "3pt_miss",
+        "페인트존2점슛성공": "paint_2pt_made",
+        "자유투성공": "ft_made",
+        "자유투실패": "ft_miss",
+        "공격리바운드": "off_rebound",
+        "수비리바운드": "def_rebound",
+        "팀공격리바운드": "team_off_rebound",
+        "팀수비리바운드": "team_def_rebound",
+        "어시스트": "assist",
+        "스틸": "steal",
+        "블록": "block",
+        "턴오버": "turnover",
+        "팀턴오버": "team_turnover",
+        "파울": "foul",
+        "테크니컬파울": "tech_foul",
+        "교체(IN)": "sub_in",
+        "교체(OUT)": "sub_out",
+        "속공성공": "fastbreak_made",
+        "속공실패": "fastbreak_miss",
+        "굿디펜스": "good_defense",
+        "정규작전타임": "timeout",
+        "UnsportsManLike": "unsportsmanlike_foul",
+    }
+)
 
-# Event type categories
-EVENT_TYPE_CATEGORIES = {
-    "2pt_made": "scoring",
-    "2pt_miss": "scoring",
-    "3pt_made": "scoring",
-    "3pt_miss": "scoring",
-    "paint_2pt_made": "scoring",
-    "ft_made": "scoring",
-    "ft_miss": "scoring",
-    "off_rebound": "rebounding",
-    "def_rebound": "rebounding",
-    "team_off_rebound": "rebounding",
-    "team_def_rebound": "rebounding",
-    "assist": "playmaking",
-    "steal": "defense",
-    "block": "defense",
-    "turnover": "turnover",
-    "team_turnover": "turnover",
-    "foul": "foul",
-    "tech_foul": "foul",
-    "sub_in": "substitution",
-    "sub_out": "substitution",
-    "fastbreak_made": "scoring",
-    "fastbreak_miss": "scoring",
-    "good_defense": "defense",
-    "timeout": "other",
-    "unsportsmanlike_foul": "foul",
-}
+# (Korean label, code) pairs, longest label first, so substring matching of
+# play-by-play descriptions never stops at a shorter partial label.
+EVENT_TYPE_MATCH_ORDER = tuple(
+    sorted(EVENT_TYPE_MAP.items(), key=lambda item: len(item[0]), reverse=True)
+)
 
+# Event type categories, read-only
+EVENT_TYPE_CATEGORIES = MappingProxyType(
+    {
+        "2pt_made": "scoring",
+        "2pt_miss": "scoring",
+        "3pt_made": "scoring",
+        "3pt_miss": "scoring",
+        "paint_2pt_made": "scoring",
+        "ft_made": "scoring",
+        "ft_miss": "scoring",
+        "off_rebound": "rebounding",
+        "def_rebound": "rebounding",
+        "team_off_rebound": "rebounding",
+        "team_def_rebound": "rebounding",
+        "assist": "playmaking",
+        "steal": "defense",
+        "block": "defense",
+        "turnover": "turnover",
+        "team_turnover": "turnover",
+        "foul": "foul",
+        "tech_foul": "foul",
+        "sub_in": "substitution",
+        "sub_out": "substitution",
+        "fastbreak_made": "scoring",
+        "fastbreak_miss": "scoring",
+        "good_defense": "defense",
+        "timeout": "other",
+        "unsportsmanlike_foul": "foul",
+    }
+)
+
+# Korean label → (code, category), derived from the two maps above so
+# callers needing both resolve them with a single lookup.
+EVENT_TYPE_FULL = MappingProxyType(
+    {
+        kr_name: (code, EVENT_TYPE_CATEGORIES.get(code, "other"))
+        for kr_name, code in EVENT_TYPE_MAP.items()
+    }
+)
 
-def get_shot_zone(x, y):
-    """Classify shot zone from WKBL court coordinates.
+
+# Shot zone boundaries (WKBL court px), compared as squared distances from the
+# basket so classification needs no square root.
+_SHOT_BASKET_X = 150.0
+_SHOT_BASKET_Y = 10.0
+_SHOT_PAINT_DIST_SQ = 50.0 * 50.0
+_SHOT_THREE_PT_DIST_SQ = 120.0 * 120.0
+# Indexed by the number of zone thresholds a shot's distance crosses
+_SHOT_ZONE_LABELS = ("paint", "mid_range", "three_pt")
+
+
+def _shot_zone_id(x, y):
+    """Return the shot zone index (0 paint, 1 mid_range, 2 three_pt)."""
+    dx = x - _SHOT_BASKET_X
+    dy = y - _SHOT_BASKET_Y
+    dist_sq = dx * dx + dy * dy
+    # Paint within ~50px of the basket, three-point beyond ~120px
+    return (dist_sq > _SHOT_PAINT_DIST_SQ) + (dist_sq >= _SHOT_THREE_PT_DIST_SQ)
+
+
+def get_shot_zones(xs, ys):
+    """Classify a batch of shots from WKBL court coordinates.
 
     Court coordinate system (half court, 0-based px):
       X range: ~0-291, Y range: ~18-176
       Basket is roughly at (150, 10) based on coordinate distribution.
 
+    Args:
+        xs: Iterable of X coordinates (px)
+        ys: Iterable of Y coordinates (px), same length as ``xs``
+
+    Returns:
+        List of shot zone strings (paint, mid_range, three_pt), one per shot
+    """
+    labels = _SHOT_ZONE_LABELS
+    return [labels[_shot_zone_id(x, y)] for x, y in zip(xs, ys)]
+
+
+def get_shot_zone(x, y):
+    """Classify shot zone from WKBL court coordinates.
+
     Args:
         x: X coordinate (px)
         y: Y coordinate (px)
@@ -131,86 +198,108 @@ def get_shot_zone(x, y):
     Returns:
         Shot zone string: paint, mid_range, three_pt
     """
-    # Distance from basket center (approx 150, 10)
-    bx, by = 150.0, 10.0
-    dx = x - bx
-    dy = y - by
-    dist = (dx * dx + dy * dy) ** 0.5
-
-    # Paint area (roughly within 50px of basket)
-    if dist <= 50:
-        return "paint"
-    # Three-point line (roughly 120px from basket)
-    if dist >= 120:
-        return "three_pt"
-    return "mid_range"
+    return _SHOT_ZONE_LABELS[_shot_zone_id(x, y)]
 
 
 # Server Settings
-HOST = os.getenv("HOST", "")
-PORT = int(os.getenv("PORT", "8000"))
+HOST = _ENV.get("HOST", "")
+PORT = _parse_int_env("PORT", 8000)
 
-# API Security Settings
-API_ALLOW_ORIGINS = _parse_csv_env(
-    "API_ALLOW_ORIGINS",
-    "http://localhost:8000,http://127.0.0.1:8000",
-)
-API_ALLOW_METHODS = _parse_csv_env("API_ALLOW_METHODS", "GET")
-API_ALLOW_HEADERS = _parse_csv_env("API_ALLOW_HEADERS", "Content-Type")
-API_ALLOW_CREDENTIALS = _parse_bool_env("API_ALLOW_CREDENTIALS", False)
-API_TRUST_PROXY = _parse_bool_env("API_TRUST_PROXY", True)
-API_TRUSTED_PROXIES = _parse_csv_env(
-    "API_TRUSTED_PROXIES",
-    "127.0.0.1/32,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,localhost",
-)
-API_RATE_LIMIT_PER_MINUTE = int(os.getenv("API_RATE_LIMIT_PER_MINUTE", "60"))
-API_SEARCH_RATE_LIMIT_PER_MINUTE = int(
-    os.getenv("API_SEARCH_RATE_LIMIT_PER_MINUTE", "20")
-)
-API_RATE_LIMIT_WINDOW_SECONDS = int(os.getenv("API_RATE_LIMIT_WINDOW_SECONDS", "60"))
-API_MAX_REQUEST_BYTES = int(os.getenv("API_MAX_REQUEST_BYTES", str(1024 * 1024)))
-API_RATE_LIMIT_MAX_KEYS = int(os.getenv("API_RATE_LIMIT_MAX_KEYS", "10000"))
-API_RATE_LIMIT_SWEEP_EVERY = int(os.getenv("API_RATE_LIMIT_SWEEP_EVERY", "200"))
-
-# Response Security Header Settings
-SECURITY_HSTS_MAX_AGE = int(os.getenv("SECURITY_HSTS_MAX_AGE", "31536000"))
-SECURITY_HSTS_INCLUDE_SUBDOMAINS = _parse_bool_env(
-    "SECURITY_HSTS_INCLUDE_SUBDOMAINS", True
-)
-SECURITY_HSTS_PRELOAD = _parse_bool_env("SECURITY_HSTS_PRELOAD", False)
-SECURITY_REFERRER_POLICY = os.getenv(
-    "SECURITY_REFERRER_POLICY", "strict-origin-when-cross-origin"
-)
-SECURITY_PERMISSIONS_POLICY = os.getenv(
-    "SECURITY_PERMISSIONS_POLICY",
-    "geolocation=(), microphone=(), camera=(), payment=(), usb=()",
-)
-SECURITY_FRAME_OPTIONS = os.getenv("SECURITY_FRAME_OPTIONS", "DENY")
-SECURITY_ALLOW_UNSAFE_EVAL = _parse_bool_env("SECURITY_ALLOW_UNSAFE_EVAL", False)
-_script_src = "script-src 'self' 'wasm-unsafe-eval'"
-if SECURITY_ALLOW_UNSAFE_EVAL:
-    _script_src += " 'unsafe-eval'"
-_script_src += "; "
-SECURITY_CONTENT_SECURITY_POLICY = os.getenv(
-    "SECURITY_CONTENT_SECURITY_POLICY",
-    "default-src 'self'; "
-    + _script_src
-    + "style-src 'self' https://fonts.googleapis.com; "
-    + "font-src 'self' https://fonts.gstatic.com data:; "
-    + "img-src 'self' data: blob:; "
-    + "connect-src 'self'; "
-    + "object-src 'none'; "
-    + "base-uri 'self'; "
-    + "frame-ancestors 'none';",
+# API and response security settings are only read by the web server, so
+# they are parsed on first access (PEP 562) instead of at import; ingest CLI
+# runs never pay for them.
+_ONE_MB = 1048576
+_CSP_TAIL = (
+    "style-src 'self' https://fonts.googleapis.com; "
+    "font-src 'self' https://fonts.gstatic.com data:; "
+    "img-src 'self' data: blob:; "
+    "connect-src 'self'; "
+    "object-src 'none'; "
+    "base-uri 'self'; "
+    "frame-ancestors 'none';"
 )
 
+
+def _content_security_policy() -> str:
+    script_src = "script-src 'self' 'wasm-unsafe-eval'"
+    if _parse_bool_env("SECURITY_ALLOW_UNSAFE_EVAL", False):
+        script_src += " 'unsafe-eval'"
+    default = "default-src 'self'; " + script_src + "; " + _CSP_TAIL
+    return _ENV.get("SECURITY_CONTENT_SECURITY_POLICY", default)
+
+
+_LAZY_SETTINGS = {
+    # API Security Settings
+    "API_ALLOW_ORIGINS": lambda: _parse_csv_env(
+        "API_ALLOW_ORIGINS",
+        "http://localhost:8000,http://127.0.0.1:8000",
+    ),
+    "API_ALLOW_METHODS": lambda: _parse_csv_env("API_ALLOW_METHODS", "GET"),
+    "API_ALLOW_HEADERS": lambda: _parse_csv_env("API_ALLOW_HEADERS", "Content-Type"),
+    "API_ALLOW_CREDENTIALS": lambda: _parse_bool_env("API_ALLOW_CREDENTIALS", False),
+    "API_TRUST_PROXY": lambda: _parse_bool_env("API_TRUST_PROXY", True),
+    "API_TRUSTED_PROXIES": lambda: _parse_csv_env(
+        "API_TRUSTED_PROXIES",
+        "127.0.0.1/32,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,localhost",
+    ),
+    "API_RATE_LIMIT_PER_MINUTE": lambda: _parse_int_env(
+        "API_RATE_LIMIT_PER_MINUTE", 60
+    ),
+    "API_SEARCH_RATE_LIMIT_PER_MINUTE": lambda: _parse_int_env(
+        "API_SEARCH_RATE_LIMIT_PER_MINUTE", 20
+    ),
+    "API_RATE_LIMIT_WINDOW_SECONDS": lambda: _parse_int_env(
+        "API_RATE_LIMIT_WINDOW_SECONDS", 60
+    ),
+    "API_MAX_REQUEST_BYTES": lambda: _parse_int_env("API_MAX_REQUEST_BYTES", _ONE_MB),
+    "API_RATE_LIMIT_MAX_KEYS": lambda: _parse_int_env("API_RATE_LIMIT_MAX_KEYS", 10000),
+    "API_RATE_LIMIT_SWEEP_EVERY": lambda: _parse_int_env(
+        "API_RATE_LIMIT_SWEEP_EVERY", 200
+    ),
+    # Response Security Header Settings
+    "SECURITY_HSTS_MAX_AGE": lambda: _parse_int_env("SECURITY_HSTS_MAX_AGE", 31536000),
+    "SECURITY_HSTS_INCLUDE_SUBDOMAINS": lambda: _parse_bool_env(
+        "SECURITY_HSTS_INCLUDE_SUBDOMAINS", True
+    ),
+    "SECURITY_HSTS_PRELOAD": lambda: _parse_bool_env("SECURITY_HSTS_PRELOAD", False),
+    "SECURITY_REFERRER_POLICY": lambda: _ENV.get(
+        "SECURITY_REFERRER_POLICY", "strict-origin-when-cross-origin"
+    ),
+    "SECURITY_PERMISSIONS_POLICY": lambda: _ENV.get(
+        "SECURITY_PERMISSIONS_POLICY",
+        "geolocation=(), microphone=(), camera=(), payment=(), usb=()",
+    ),
+    "SECURITY_FRAME_OPTIONS": lambda: _ENV.get("SECURITY_FRAME_OPTIONS", "DENY"),
+    "SECURITY_ALLOW_UNSAFE_EVAL": lambda: _parse_bool_env(
+        "SECURITY_ALLOW_UNSAFE_EVAL", False
+    ),
+    "SECURITY_CONTENT_SECURITY_POLICY": _content_security_policy,
+}
+
+
+def __getattr__(name):
+    factory = _LAZY_SETTINGS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    # Cache as a real module global so later lookups skip this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SETTINGS.keys())
+
+
 # Paths
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-CACHE_DIR = os.path.join(DATA_DIR, "cache")
-STATUS_PATH = os.path.join(CACHE_DIR, "ingest_status.json")
-OUTPUT_PATH = os.path.join(DATA_DIR, "wkbl-active.json")
-DB_PATH = os.path.join(DATA_DIR, "wkbl.db")
+_BASE_PATH = Path(__file__).resolve().parent.parent
+_DATA_PATH = _BASE_PATH / "data"
+BASE_DIR = str(_BASE_PATH)
+DATA_DIR = str(_DATA_PATH)
+CACHE_DIR = str(_DATA_PATH / "cache")
+STATUS_PATH = str(_DATA_PATH / "cache" / "ingest_status.json")
+OUTPUT_PATH = str(_DATA_PATH / "wkbl-active.json")
+DB_PATH = str(_DATA_PATH / "wkbl.db")
 
 # Season Settings
 CURRENT_SEASON = "2025-26"
@@ -233,16 +322,25 @@ MAX_RETRIES = 3
 RETRY_BACKOFF = 2.0
 
 
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] %(levelname)s - %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
 def setup_logging(name, level=logging.INFO):
     """Configure and return a logger with consistent formatting."""
+    logger = _build_logger(name)
+    # Applied on every call, so a level changed elsewhere since is reset.
+    logger.setLevel(level)
+    return logger
+
+
+@lru_cache(maxsize=64)
+def _build_logger(name):
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "[%(asctime)s] %(levelname)s - %(name)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
-    logger.setLevel(level)
     return logger
@@ -4,12 +4,28 @@ WKBL Stats Database Module
 SQLite database schema and operations for storing game-by-game player statistics.
 """
 
+import atexit
 import sqlite3
+import threading
+import weakref
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from config import DB_PATH, EVENT_TYPE_CATEGORIES, EVENT_TYPE_MAP, setup_logging
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from config import DB_PATH, EVENT_TYPE_FULL, setup_logging
 
 logger = setup_logging(__name__)
 
@@ -104,8 +120,6 @@ CREATE TABLE IF NOT EXISTS player_games (
     two_pm INTEGER DEFAULT 0,      -- 2점슛 성공
     two_pa INTEGER DEFAULT 0,      -- 2점슛 시도
 
-    created_at TEXT DEFAULT (datetime('now')),
-
     FOREIGN KEY (game_id) REFERENCES games(id),
     FOREIGN KEY (player_id) REFERENCES players(id),
     FOREIGN KEY (team_id) REFERENCES teams(id),
@@ -133,8 +147,6 @@ CREATE TABLE IF NOT EXISTS team_games (
     tov INTEGER DEFAULT 0,              -- 턴오버
     pf INTEGER DEFAULT 0,               -- 파울
 
-    created_at TEXT DEFAULT (datetime('now')),
-
     FOREIGN KEY (game_id) REFERENCES games(id),
     FOREIGN KEY (team_id) REFERENCES teams(id),
     UNIQUE (game_id, team_id)
@@ -172,8 +184,11 @@ CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date);
 CREATE INDEX IF NOT EXISTS idx_player_games_team_game ON player_games(team_id, game_id);
 CREATE INDEX IF NOT EXISTS idx_player_games_player_game ON player_games(player_id, game_id);
 CREATE INDEX IF NOT EXISTS idx_games_season_date_id ON games(season_id, game_date, id);
+CREATE INDEX IF NOT EXISTS idx_games_season_scored ON games(season_id, home_score, id);
 CREATE INDEX IF NOT EXISTS idx_team_games_game ON team_games(game_id);
+CREATE INDEX IF NOT EXISTS idx_team_games_team_game ON team_games(team_id, game_id);
 CREATE INDEX IF NOT EXISTS idx_team_standings_season ON team_standings(season_id);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players(team_id);
 
 -- 경기 예측 테이블
 CREATE TABLE IF NOT EXISTS game_predictions (
@@ -404,6 +419,95 @@ CREATE TABLE IF NOT EXISTS lineup_stints (
 CREATE INDEX IF NOT EXISTS idx_lineup_stints_game ON lineup_stints(game_id);
 CREATE INDEX IF NOT EXISTS idx_lineup_stints_team ON lineup_stints(team_id);
 
+-- 시즌별 선수 누적 기록 요약 (get_all_season_stats 용, player_games에서 재계산)
+CREATE TABLE IF NOT EXISTS player_season_summary (
+    season_id TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,         -- 시즌 중 소속팀 (집계 행 중 하나)
+    gp INTEGER NOT NULL,
+    min REAL,                      -- 이하 경기당 평균
+    pts REAL,
+    reb REAL,
+    ast REAL,
+    stl REAL,
+    blk REAL,
+    tov REAL,
+    total_fgm INTEGER,             -- 이하 시즌 합계
+    total_fga INTEGER,
+    total_tpm INTEGER,
+    total_tpa INTEGER,
+    total_ftm INTEGER,
+    total_fta INTEGER,
+    total_pts INTEGER,
+    total_min REAL,
+    PRIMARY KEY (season_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pss_season_pts ON player_season_summary(season_id, pts DESC);
+
+-- 요약 테이블 재계산이 필요한 시즌 (트리거가 기록, 조회 시 갱신)
+CREATE TABLE IF NOT EXISTS player_season_summary_stale (
+    season_id TEXT PRIMARY KEY
+);
+
+-- 트리거는 INSERT OR IGNORE 대신 ON CONFLICT DO NOTHING 사용
+-- (외부 upsert 문이 트리거의 OR IGNORE를 ABORT로 덮어쓰기 때문)
+CREATE TRIGGER IF NOT EXISTS trg_pss_player_games_insert AFTER INSERT ON player_games
+BEGIN
+    INSERT INTO player_season_summary_stale
+    SELECT season_id FROM games WHERE id = NEW.game_id
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_player_games_update AFTER UPDATE ON player_games
+BEGIN
+    INSERT INTO player_season_summary_stale
+    SELECT season_id FROM games WHERE id IN (OLD.game_id, NEW.game_id)
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_player_games_delete AFTER DELETE ON player_games
+BEGIN
+    INSERT INTO player_season_summary_stale
+    SELECT season_id FROM games WHERE id = OLD.game_id
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_games_insert AFTER INSERT ON games
+BEGIN
+    INSERT INTO player_season_summary_stale
+    VALUES (NEW.season_id)
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_games_update AFTER UPDATE OF id, season_id ON games
+BEGIN
+    INSERT INTO player_season_summary_stale
+    VALUES (OLD.season_id), (NEW.season_id)
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_games_delete AFTER DELETE ON games
+BEGIN
+    INSERT INTO player_season_summary_stale
+    VALUES (OLD.season_id)
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_teams_insert AFTER INSERT ON teams
+BEGIN
+    INSERT INTO player_season_summary_stale
+    SELECT DISTINCT season_id FROM games WHERE true
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pss_teams_delete AFTER DELETE ON teams
+BEGIN
+    INSERT INTO player_season_summary_stale
+    SELECT DISTINCT season_id FROM games WHERE true
+    ON CONFLICT DO NOTHING;
+END;
+
 -- 메타데이터 테이블 (테이블/컬럼 설명)
 CREATE TABLE IF NOT EXISTS _meta_descriptions (
     table_name TEXT NOT NULL,
@@ -424,6 +528,8 @@ META_DESCRIPTIONS = [
     ("player_games", "", "경기별 선수 기록 (핵심 테이블)"),
     ("team_games", "", "경기별 팀 기록"),
     ("team_standings", "", "시즌 팀 순위"),
+    ("player_season_summary", "", "시즌별 선수 누적 기록 요약 (player_games 집계)"),
+    ("player_season_summary_stale", "", "요약 재계산이 필요한 시즌 목록"),
     # seasons 컬럼
     ("seasons", "id", "WKBL 시즌 코드 (예: 046)"),
     ("seasons", "label", "시즌 라벨 (예: 2025-26)"),
@@ -569,6 +675,28 @@ META_DESCRIPTIONS = [
     ("lineup_stints", "duration_seconds", "구간 시간 (초)"),
     ("lineup_stints", "start_score_for", "구간 시작 자팀 점수"),
     ("lineup_stints", "end_score_for", "구간 종료 자팀 점수"),
+    # player_season_summary 테이블
+    ("player_season_summary", "season_id", "시즌 코드"),
+    ("player_season_summary", "player_id", "선수 ID"),
+    ("player_season_summary", "team_id", "소속팀 ID (집계 행 중 하나)"),
+    ("player_season_summary", "gp", "출전 경기 수"),
+    ("player_season_summary", "min", "경기당 평균 출전 시간 (분)"),
+    ("player_season_summary", "pts", "경기당 평균 득점"),
+    ("player_season_summary", "reb", "경기당 평균 리바운드"),
+    ("player_season_summary", "ast", "경기당 평균 어시스트"),
+    ("player_season_summary", "stl", "경기당 평균 스틸"),
+    ("player_season_summary", "blk", "경기당 평균 블록"),
+    ("player_season_summary", "tov", "경기당 평균 턴오버"),
+    ("player_season_summary", "total_fgm", "시즌 총 야투 성공"),
+    ("player_season_summary", "total_fga", "시즌 총 야투 시도"),
+    ("player_season_summary", "total_tpm", "시즌 총 3점슛 성공"),
+    ("player_season_summary", "total_tpa", "시즌 총 3점슛 시도"),
+    ("player_season_summary", "total_ftm", "시즌 총 자유투 성공"),
+    ("player_season_summary", "total_fta", "시즌 총 자유투 시도"),
+    ("player_season_summary", "total_pts", "시즌 총 득점"),
+    ("player_season_summary", "total_min", "시즌 총 출전 시간 (분)"),
+    # player_season_summary_stale 테이블
+    ("player_season_summary_stale", "season_id", "요약 재계산이 필요한 시즌 코드"),
 ]
 
 # WKBL 팀 마스터 데이터
@@ -581,20 +709,335 @@ TEAMS_DATA = [
     ("bnk", "BNK썸", "BNK", None, 2014),
 ]
 
+# 이벤트 유형 마스터 데이터 (config.EVENT_TYPE_FULL 기반)
+EVENT_TYPES_DATA = [
+    (code, name_kr, code, category)
+    for name_kr, (code, category) in EVENT_TYPE_FULL.items()
+]
+
 KNOWN_EXHIBITION_GAME_IDS = ("04601001",)
 
 
+class _CachedConnection:
+    """A thread's long-lived connection to one database file."""
+
+    __slots__ = ("conn", "depth", "generation")
+
+    def __init__(self, conn: sqlite3.Connection, generation: int):
+        self.conn = conn
+        self.depth = 0
+        self.generation = generation
+
+
+class _ThreadConnections(dict):
+    """A thread's cached connections, keyed by database path.
+
+    ``owned`` lists every connection the thread opened; it is kept apart from
+    the dict so the finalizer that closes them does not keep the dict alive.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.owned: List[Tuple[str, sqlite3.Connection]] = []
+
+
+_local = threading.local()
+_all_connections: Dict[str, List[sqlite3.Connection]] = {}
+# Re-entrant: a finished thread's finalizer may run (via gc) on a thread that
+# already holds it.
+_connections_lock = threading.RLock()
+# Bumped by close_connections() so other threads' cached entries go stale.
+_generation = 0
+
+
+# Per-connection tuning. page_size only takes effect on a new, empty database
+# and must precede the switch to WAL, which fixes the page size.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+# Cached connections are long-lived; size the prepared-statement cache to hold
+# the module's distinct queries (the sqlite3 default is 128).
+_STATEMENT_CACHE_SIZE = 512
+
+
+class _Connection(sqlite3.Connection):
+    """Connection whose ``commit()`` is deferred inside :func:`write_batch`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_depth = 0
+
+    def commit(self):
+        if not self.batch_depth:
+            super().commit()
+
+
+def _release_connections(owned: List[Tuple[str, sqlite3.Connection]]):
+    """Close a finished thread's connections and drop them from the registry.
+
+    Only connections still in the registry are closed here. Whoever removes a
+    connection from the registry, under the lock, owns closing it, so this
+    never closes one that :func:`close_connections` is checkpointing.
+    """
+    released = []
+    with _connections_lock:
+        for path, conn in owned:
+            conns = _all_connections.get(path)
+            if conns and conn in conns:
+                # The path stays registered, even with no connections left,
+                # so close_connections() still switches it out of WAL mode.
+                conns.remove(conn)
+                released.append(conn)
+        owned.clear()
+    for conn in released:
+        conn.close()
+
+
+def _thread_connections() -> _ThreadConnections:
+    """Return the calling thread's connection cache, creating it on first use.
+
+    ``threading.local`` drops the cache when the thread exits, which closes
+    its connections; worker pools that retire idle threads would otherwise
+    leave them open until :func:`close_connections` runs at process exit.
+    """
+    cache = getattr(_local, "connections", None)
+    if cache is None:
+        cache = _local.connections = _ThreadConnections()
+        finalizer = weakref.finalize(cache, _release_connections, cache.owned)
+        # At exit close_connections() runs instead, so it can checkpoint.
+        finalizer.atexit = False
+    return cache
+
+
+def _connect(
+    path: str, owned: List[Tuple[str, sqlite3.Connection]]
+) -> _CachedConnection:
+    conn = sqlite3.connect(
+        path,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        factory=_Connection,
+    )
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA page_size=8192")
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.OperationalError:
+        # Read-only database files stay in rollback-journal mode.
+        pass
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    owned.append((path, conn))
+    with _connections_lock:
+        _all_connections.setdefault(path, []).append(conn)
+        return _CachedConnection(conn, _generation)
+
+
 @contextmanager
 def get_connection():
-    """Database connection context manager."""
-    conn = None
+    """Database connection context manager.
+
+    Connections are cached per thread and database path and reused across
+    calls instead of reconnecting every time. Nested blocks share the same
+    connection; when the outermost block exits, any transaction that was not
+    committed is rolled back, as closing the connection used to do.
+    """
+    path = str(DB_PATH)
+    cache = _thread_connections()
+    entry = cache.get(path)
+    if entry is None or entry.generation != _generation:
+        entry = cache[path] = _connect(path, cache.owned)
+    conn = entry.conn
+    entry.depth += 1
+    try:
+        yield conn
+    finally:
+        entry.depth -= 1
+        if entry.depth == 0 and entry.generation == _generation and conn.in_transaction:
+            conn.rollback()
+
+
+def _begin_immediate(conn: sqlite3.Connection):
+    """Open a write transaction now, unless one is already open.
+
+    Bulk writers call this first so the write lock is taken before any
+    statement runs, and all of their rows share one commit.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+
+def _sqlite_now() -> str:
+    """Current UTC time in the format of SQLite's ``datetime('now')``.
+
+    Bulk writers bind this once so every row of a batch shares one stamp.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@contextmanager
+def write_batch():
+    """Group-commit every write made on this thread inside the block.
+
+    Helpers keep calling ``conn.commit()``; within the block those commits are
+    deferred, and the whole batch is committed once on exit (or rolled back if
+    the block raises). Blocks may nest; only the outermost one commits. The
+    outermost block takes the write lock up front (``BEGIN IMMEDIATE``) so a
+    concurrent writer fails fast instead of mid-batch on lock upgrade.
+    """
+    with get_connection() as conn:
+        if not conn.batch_depth:
+            _begin_immediate(conn)
+        conn.batch_depth += 1
+        try:
+            yield conn
+        except BaseException:
+            conn.batch_depth -= 1
+            if not conn.batch_depth:
+                conn.rollback()
+            raise
+        conn.batch_depth -= 1
+        if not conn.batch_depth:
+            conn.commit()
+
+
+@contextmanager
+def bulk_load():
+    """Run a large rebuild on this thread with ``synchronous=OFF``.
+
+    Commits stop waiting for fsync, which dominates multi-season loads. An
+    application crash still leaves a consistent database, but an OS crash or
+    power loss during the block may corrupt it, so only use this for data
+    that can be re-ingested from the source. ``NORMAL`` is restored on exit.
+
+    Only the pragma spans the block; the connection is not held open, so a
+    helper that fails inside it still has its partial writes rolled back.
+    """
+    with get_connection() as conn:
+        conn.execute("PRAGMA synchronous=OFF")
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
         yield conn
     finally:
-        if conn:
+        with get_connection() as conn:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def close_connections():
+    """Close every cached connection, across all threads.
+
+    Registered with ``atexit``; also useful before copying or deleting the
+    database file. The WAL is checkpointed and the file switched back to
+    rollback-journal mode so the ``.db`` on disk is self-contained (the
+    frontend loads it with sql.js, and ``-wal``/``-shm`` files are not
+    shipped). It must have run, in every process that opened the file,
+    before ``data/wkbl.db`` is published; ``split_db.py`` refuses a source
+    that is still open elsewhere.
+    """
+    global _generation
+    with _connections_lock:
+        # Taking the connections out of the registry claims them; finalizers of
+        # finished threads then leave them alone (see _release_connections).
+        by_path = list(_all_connections.items())
+        _all_connections.clear()
+        _generation += 1
+    for path, conns in by_path:
+        # Threads that have exited already closed theirs; reopen to checkpoint.
+        last = conns.pop() if conns else sqlite3.connect(path)
+        for conn in conns:
             conn.close()
+        try:
+            last.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            last.execute("PRAGMA journal_mode=DELETE")
+        except sqlite3.Error:
+            # Another process still has the file open; it stays in WAL mode.
+            pass
+        last.close()
+    cache = getattr(_local, "connections", None)
+    if cache is not None:
+        cache.clear()
+        cache.owned.clear()
+
+
+atexit.register(close_connections)
+
+
+def _iter_dicts(conn: sqlite3.Connection, sql: str, params=()) -> Iterator[Dict]:
+    """Yield result rows as dicts, zipping plain tuples with the column names.
+
+    Bypasses the connection's ``sqlite3.Row`` factory, whose per-column
+    lookups make ``dict(row)`` roughly twice as slow on wide result sets.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    columns = [d[0] for d in cursor.description]
+    for row in cursor:
+        yield dict(zip(columns, row))
+
+
+# Conservative bound on bound parameters per statement (SQLite's historical
+# SQLITE_MAX_VARIABLE_NUMBER default).
+_MAX_SQL_VARIABLES = 999
+
+
+@lru_cache(maxsize=64)
+def _multi_values_sql(head: str, width: int, rows: int, tail: str = "") -> str:
+    row = "(" + ",".join("?" * width) + ")"
+    return head + " VALUES " + ",".join([row] * rows) + tail
+
+
+def _insert_value_rows(
+    conn: sqlite3.Connection, head: str, rows: List[tuple], tail: str = ""
+):
+    """Insert value tuples using multi-row ``VALUES`` statements.
+
+    Args:
+        conn: Open connection
+        head: Statement up to the column list, e.g. ``INSERT INTO t (a, b)``
+        rows: Equal-length tuples in column-list order
+        tail: Optional clause after the values, e.g. an ``ON CONFLICT`` upsert
+    """
+    if not rows:
+        return
+    width = len(rows[0])
+    per_statement = max(_MAX_SQL_VARIABLES // width, 1)
+    for start in range(0, len(rows), per_statement):
+        chunk = rows[start : start + per_statement]
+        params = [value for row in chunk for value in row]
+        conn.execute(_multi_values_sql(head, width, len(chunk), tail), params)
+
+
+def _insert_multi_values(
+    conn: sqlite3.Connection,
+    head: str,
+    columns: tuple,
+    records: List[Dict[str, Any]],
+    tail: str = "",
+):
+    """Insert dict records using multi-row ``VALUES`` statements.
+
+    Args:
+        conn: Open connection
+        head: Statement up to the column list, e.g. ``INSERT INTO t (a, b)``
+        columns: Record keys in the same order as the column list (2 or more)
+        records: Rows to insert
+        tail: Optional clause after the values, e.g. an ``ON CONFLICT`` upsert
+    """
+    _insert_value_rows(conn, head, list(map(itemgetter(*columns), records)), tail)
+
+
+def _seed_master_rows(conn: sqlite3.Connection, table: str, head: str, rows: list):
+    """Insert master rows unless ``table`` already holds that many rows."""
+    count = conn.execute(
+        f"SELECT COUNT(*) FROM {table}"  # nosec B608 — hardcoded table name
+    ).fetchone()[0]
+    if count != len(rows):
+        _insert_value_rows(conn, head, rows)
 
 
 def init_db():
@@ -625,30 +1068,64 @@ def init_db():
             except Exception:  # nosec B110 — intentional: column may already exist
                 pass
 
+        # Drop unused columns from the box-score tables; narrower rows pack
+        # more per page for the season aggregation scans.
+        for table, col in (
+            ("player_games", "created_at"),
+            ("team_games", "created_at"),
+        ):
+            columns = {
+                row[1]
+                for row in cursor.execute(f"PRAGMA table_info({table})").fetchall()
+            }
+            if col not in columns:
+                continue
+            try:
+                cursor.execute(  # nosec B608 — table/col are hardcoded constants
+                    f"ALTER TABLE {table} DROP COLUMN {col}"
+                )
+            except sqlite3.OperationalError as e:
+                # DROP COLUMN needs SQLite 3.35+; the column is only unused.
+                logger.warning(f"Could not drop {table}.{col}: {e}")
+
         # Teams are seeded once and reused by ingest/API joins.
         # Insert teams master data
-        cursor.executemany(
-            """INSERT OR IGNORE INTO teams (id, name, short_name, logo_url, founded_year)
-               VALUES (?, ?, ?, ?, ?)""",
+        _seed_master_rows(
+            conn,
+            "teams",
+            "INSERT OR IGNORE INTO teams"
+            " (id, name, short_name, logo_url, founded_year)",
             TEAMS_DATA,
         )
 
-        # Insert meta descriptions
-        cursor.executemany(
-            """INSERT OR REPLACE INTO _meta_descriptions (table_name, column_name, description)
-               VALUES (?, ?, ?)""",
-            META_DESCRIPTIONS,
-        )
+        # Insert meta descriptions, unless every current one is already stored
+        stored = {
+            tuple(row)
+            for row in conn.execute(
+                "SELECT table_name, column_name, description FROM _meta_descriptions"
+            )
+        }
+        if not stored.issuperset(META_DESCRIPTIONS):
+            _insert_value_rows(
+                conn,
+                "INSERT OR REPLACE INTO _meta_descriptions"
+                " (table_name, column_name, description)",
+                META_DESCRIPTIONS,
+            )
 
         # Populate event_types from config
-        event_type_data = [
-            (code, name_kr, code, EVENT_TYPE_CATEGORIES.get(code, "other"))
-            for name_kr, code in EVENT_TYPE_MAP.items()
-        ]
-        cursor.executemany(
-            """INSERT OR IGNORE INTO event_types (code, name_kr, name_en, category)
-               VALUES (?, ?, ?, ?)""",
-            event_type_data,
+        _seed_master_rows(
+            conn,
+            "event_types",
+            "INSERT OR IGNORE INTO event_types (code, name_kr, name_en, category)",
+            EVENT_TYPES_DATA,
+        )
+
+        # Rebuild season summaries lazily; also covers databases created
+        # before the summary table existed.
+        cursor.execute(
+            """INSERT OR IGNORE INTO player_season_summary_stale
+               SELECT DISTINCT season_id FROM games"""
         )
 
         cursor.execute(
@@ -664,10 +1141,120 @@ def init_db():
                 [(gid,) for gid in KNOWN_EXHIBITION_GAME_IDS],
             )
 
+        # Planner statistics: a full ANALYZE the first time, afterwards
+        # PRAGMA optimize re-analyzes only tables whose stats have drifted.
+        has_stats = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        cursor.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+
         conn.commit()
         logger.info(f"Database initialized at {DB_PATH}")
 
 
+# Per-row write statements used by ingest loops. Module constants bind the same
+# SQL text on every call, so the cached connection's statement cache reuses the
+# prepared statement instead of compiling it again.
+_INSERT_SEASON_SQL = """INSERT INTO seasons
+    (id, label, start_date, end_date, is_playoff)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+      label = excluded.label,
+      start_date = excluded.start_date,
+      end_date = excluded.end_date,
+      is_playoff = excluded.is_playoff"""
+
+_UPSERT_PLAYER_SQL = """INSERT INTO players
+    (id, name, team_id, position, height, birth_date, is_active)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+      name = excluded.name,
+      team_id = excluded.team_id,
+      position = COALESCE(excluded.position, players.position),
+      height = COALESCE(excluded.height, players.height),
+      birth_date = COALESCE(excluded.birth_date, players.birth_date),
+      is_active = excluded.is_active"""
+
+# Where supported (SQLite 3.35+), box-score upserts hand back the row id inline.
+_RETURNING_ID = " RETURNING id" if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+# Re-ingesting a game updates rows in place (ON CONFLICT DO UPDATE) rather than
+# INSERT OR REPLACE, which deletes and re-inserts the row and every index entry.
+_INSERT_GAME_SQL = """INSERT INTO games
+    (id, season_id, game_date, home_team_id, away_team_id,
+     home_score, away_score, home_q1, home_q2, home_q3, home_q4, home_ot,
+     away_q1, away_q2, away_q3, away_q4, away_ot, venue, game_type, is_exhibition)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+      season_id = excluded.season_id,
+      game_date = excluded.game_date,
+      home_team_id = excluded.home_team_id,
+      away_team_id = excluded.away_team_id,
+      home_score = excluded.home_score,
+      away_score = excluded.away_score,
+      home_q1 = excluded.home_q1,
+      home_q2 = excluded.home_q2,
+      home_q3 = excluded.home_q3,
+      home_q4 = excluded.home_q4,
+      home_ot = excluded.home_ot,
+      away_q1 = excluded.away_q1,
+      away_q2 = excluded.away_q2,
+      away_q3 = excluded.away_q3,
+      away_q4 = excluded.away_q4,
+      away_ot = excluded.away_ot,
+      venue = excluded.venue,
+      game_type = excluded.game_type,
+      is_exhibition = MAX(excluded.is_exhibition, COALESCE(games.is_exhibition, 0))"""
+
+_INSERT_PLAYER_GAME_SQL = (
+    """INSERT INTO player_games
+    (game_id, player_id, team_id, minutes, pts, off_reb, def_reb, reb,
+     ast, stl, blk, tov, pf, fgm, fga, tpm, tpa, ftm, fta, two_pm, two_pa)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(game_id, player_id) DO UPDATE SET
+      team_id = excluded.team_id,
+      minutes = excluded.minutes,
+      pts = excluded.pts,
+      off_reb = excluded.off_reb,
+      def_reb = excluded.def_reb,
+      reb = excluded.reb,
+      ast = excluded.ast,
+      stl = excluded.stl,
+      blk = excluded.blk,
+      tov = excluded.tov,
+      pf = excluded.pf,
+      fgm = excluded.fgm,
+      fga = excluded.fga,
+      tpm = excluded.tpm,
+      tpa = excluded.tpa,
+      ftm = excluded.ftm,
+      fta = excluded.fta,
+      two_pm = excluded.two_pm,
+      two_pa = excluded.two_pa"""
+    + _RETURNING_ID  # nosec B608 — appends a constant clause
+)
+
+_INSERT_TEAM_GAME_SQL = (
+    """INSERT INTO team_games
+    (game_id, team_id, is_home, fast_break_pts, paint_pts,
+     two_pts, three_pts, reb, ast, stl, blk, tov, pf)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(game_id, team_id) DO UPDATE SET
+      is_home = excluded.is_home,
+      fast_break_pts = excluded.fast_break_pts,
+      paint_pts = excluded.paint_pts,
+      two_pts = excluded.two_pts,
+      three_pts = excluded.three_pts,
+      reb = excluded.reb,
+      ast = excluded.ast,
+      stl = excluded.stl,
+      blk = excluded.blk,
+      tov = excluded.tov,
+      pf = excluded.pf"""
+    + _RETURNING_ID  # nosec B608 — appends a constant clause
+)
+
+
 def insert_season(
     season_id: str,
     label: str,
@@ -678,8 +1265,7 @@ def insert_season(
     """Insert or update a season."""
     with get_connection() as conn:
         conn.execute(
-            """INSERT OR REPLACE INTO seasons (id, label, start_date, end_date, is_playoff)
-               VALUES (?, ?, ?, ?, ?)""",
+            _INSERT_SEASON_SQL,
             (season_id, label, start_date, end_date, is_playoff),
         )
         conn.commit()
@@ -697,15 +1283,7 @@ def insert_player(
     """Insert or update a player, preserving existing profile data."""
     with get_connection() as conn:
         conn.execute(
-            """INSERT INTO players (id, name, team_id, position, height, birth_date, is_active)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(id) DO UPDATE SET
-                 name = excluded.name,
-                 team_id = excluded.team_id,
-                 position = COALESCE(excluded.position, players.position),
-                 height = COALESCE(excluded.height, players.height),
-                 birth_date = COALESCE(excluded.birth_date, players.birth_date),
-                 is_active = excluded.is_active""",
+            _UPSERT_PLAYER_SQL,
             (player_id, name, team_id, position, height, birth_date, is_active),
         )
         conn.commit()
@@ -733,24 +1311,17 @@ def insert_game(
     venue: Optional[str] = None,
     is_exhibition: Optional[int] = None,
 ):
-    """Insert or update a game."""
+    """Insert or update a game.
+
+    An existing exhibition flag is kept; the upsert never clears it.
+    """
     if is_exhibition is None:
         is_exhibition = 1 if game_type == "allstar" else 0
+    if game_id in KNOWN_EXHIBITION_GAME_IDS:
+        is_exhibition = 1
     with get_connection() as conn:
-        existing = conn.execute(
-            "SELECT is_exhibition FROM games WHERE id = ?",
-            (game_id,),
-        ).fetchone()
-        if game_id in KNOWN_EXHIBITION_GAME_IDS or (
-            existing and int(existing["is_exhibition"] or 0) == 1
-        ):
-            is_exhibition = 1
         conn.execute(
-            """INSERT OR REPLACE INTO games
-               (id, season_id, game_date, home_team_id, away_team_id,
-                home_score, away_score, home_q1, home_q2, home_q3, home_q4, home_ot,
-                away_q1, away_q2, away_q3, away_q4, away_ot, venue, game_type, is_exhibition)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            _INSERT_GAME_SQL,
             (
                 game_id,
                 season_id,
@@ -780,13 +1351,14 @@ def insert_game(
 def insert_player_game(
     game_id: str, player_id: str, team_id: str, stats: Dict[str, Any]
 ):
-    """Insert a player's game stats."""
+    """Insert or update a player's game stats.
+
+    Returns:
+        The player_games row id, or None on SQLite builds without RETURNING.
+    """
     with get_connection() as conn:
-        conn.execute(
-            """INSERT OR REPLACE INTO player_games
-               (game_id, player_id, team_id, minutes, pts, off_reb, def_reb, reb,
-                ast, stl, blk, tov, pf, fgm, fga, tpm, tpa, ftm, fta, two_pm, two_pa)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        cursor = conn.execute(
+            _INSERT_PLAYER_GAME_SQL,
             (
                 game_id,
                 player_id,
@@ -811,33 +1383,82 @@ def insert_player_game(
                 stats.get("two_pa", 0),
             ),
         )
+        row = cursor.fetchone()
         conn.commit()
+        return row[0] if row else None
+
+
+# Secondary player_games indexes that bulk loads may drop and rebuild. The
+# UNIQUE (game_id, player_id) index stays, since the upsert conflicts on it.
+_PLAYER_GAMES_INDEXES = {
+    "idx_player_games_game": "player_games(game_id)",
+    "idx_player_games_player": "player_games(player_id)",
+    "idx_player_games_team": "player_games(team_id)",
+    "idx_player_games_team_game": "player_games(team_id, game_id)",
+    "idx_player_games_player_game": "player_games(player_id, game_id)",
+}
+# Below this many rows, rebuilding the indexes costs more than maintaining them.
+_INDEX_REBUILD_MIN_ROWS = 5000
+
+_PLAYER_GAMES_COLUMNS = tuple(
+    (
+        "game_id player_id team_id minutes pts off_reb def_reb reb ast stl blk "
+        "tov pf fgm fga tpm tpa ftm fta two_pm two_pa"
+    ).split()
+)
+_PLAYER_GAMES_INSERT_HEAD = (
+    f"INSERT INTO player_games ({', '.join(_PLAYER_GAMES_COLUMNS)})"
+)
+_PLAYER_GAMES_UPSERT_TAIL = (
+    " ON CONFLICT(game_id, player_id) DO UPDATE SET "  # nosec B608 — fixed columns
+    + ", ".join(f"{col} = excluded.{col}" for col in _PLAYER_GAMES_COLUMNS[2:])
+)
+
+
+def bulk_insert_player_games(
+    records: List[Dict[str, Any]], rebuild_indexes: bool = True
+):
+    """Bulk insert player game records.
 
+    Rows are written with multi-row ``VALUES`` statements inside one
+    ``BEGIN IMMEDIATE`` transaction. Large batches drop the secondary indexes
+    first, rebuild them once at the end and refresh the planner statistics.
 
-def bulk_insert_player_games(records: List[Dict[str, Any]]):
-    """Bulk insert player game records."""
+    Args:
+        records: Player game rows keyed by column name
+        rebuild_indexes: Allow the drop/rebuild path for large batches
+    """
     with get_connection() as conn:
-        conn.executemany(
-            """INSERT OR REPLACE INTO player_games
-               (game_id, player_id, team_id, minutes, pts, off_reb, def_reb, reb,
-                ast, stl, blk, tov, pf, fgm, fga, tpm, tpa, ftm, fta, two_pm, two_pa)
-               VALUES (:game_id, :player_id, :team_id, :minutes, :pts, :off_reb,
-                       :def_reb, :reb, :ast, :stl, :blk, :tov, :pf, :fgm, :fga,
-                       :tpm, :tpa, :ftm, :fta, :two_pm, :two_pa)""",
+        _begin_immediate(conn)
+        rebuild = rebuild_indexes and len(records) > _INDEX_REBUILD_MIN_ROWS
+        if rebuild:
+            for name in _PLAYER_GAMES_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        _insert_multi_values(
+            conn,
+            _PLAYER_GAMES_INSERT_HEAD,
+            _PLAYER_GAMES_COLUMNS,
             records,
+            _PLAYER_GAMES_UPSERT_TAIL,
         )
+        if rebuild:
+            for name, target in _PLAYER_GAMES_INDEXES.items():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            # A load this size shifts the row counts the planner relies on.
+            conn.execute("ANALYZE player_games")
         conn.commit()
         logger.info(f"Inserted {len(records)} player game records")
 
 
 def insert_team_game(game_id: str, team_id: str, is_home: int, stats: Dict[str, Any]):
-    """Insert a team's game stats."""
+    """Insert or update a team's game stats.
+
+    Returns:
+        The team_games row id, or None on SQLite builds without RETURNING.
+    """
     with get_connection() as conn:
-        conn.execute(
-            """INSERT OR REPLACE INTO team_games
-               (game_id, team_id, is_home, fast_break_pts, paint_pts,
-                two_pts, three_pts, reb, ast, stl, blk, tov, pf)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        cursor = conn.execute(
+            _INSERT_TEAM_GAME_SQL,
             (
                 game_id,
                 team_id,
@@ -854,7 +1475,9 @@ def insert_team_game(game_id: str, team_id: str, is_home: int, stats: Dict[str,
                 stats.get("pf", 0),
             ),
         )
+        row = cursor.fetchone()
         conn.commit()
+        return row[0] if row else None
 
 
 def get_team_season_stats(team_id: str, season_id: str) -> Optional[Dict]:
@@ -1026,14 +1649,12 @@ def get_player_season_stats(player_id: str, season_id: str) -> Optional[Dict]:
         return None
 
 
-def get_all_season_stats(season_id: str, active_only: bool = True) -> List[Dict]:
-    """Get aggregated stats for all players in a season."""
-    base_query = """SELECT
-                p.id,
-                p.name,
-                p.position as pos,
-                p.height,
-                t.name as team,
+# Per-player season aggregate over player_games; the single parameter is the
+# season_id. Feeds player_season_summary and the read-only fallback below.
+_SEASON_SUMMARY_SELECT = """SELECT
+                g.season_id,
+                pg.player_id,
+                pg.team_id,
                 COUNT(*) as gp,
                 AVG(pg.minutes) as min,
                 AVG(pg.pts) as pts,
@@ -1052,21 +1673,118 @@ def get_all_season_stats(season_id: str, active_only: bool = True) -> List[Dict]
                 SUM(pg.minutes) as total_min
             FROM player_games pg
             JOIN games g ON pg.game_id = g.id
-            JOIN players p ON pg.player_id = p.id
             JOIN teams t ON pg.team_id = t.id
-            WHERE g.season_id = ?"""
+            WHERE g.season_id = ?
+            GROUP BY pg.player_id"""
 
-    if active_only:
-        query = (
-            base_query
-            + " AND p.is_active = 1 GROUP BY pg.player_id ORDER BY AVG(pg.pts) DESC"
-        )
-    else:
-        query = base_query + " GROUP BY pg.player_id ORDER BY AVG(pg.pts) DESC"
+_SEASON_STATS_SELECT = """SELECT
+                p.id,
+                p.name,
+                p.position as pos,
+                p.height,
+                t.name as team,
+                s.gp,
+                s.min,
+                s.pts,
+                s.reb,
+                s.ast,
+                s.stl,
+                s.blk,
+                s.tov,
+                s.total_fgm,
+                s.total_fga,
+                s.total_tpm,
+                s.total_tpa,
+                s.total_ftm,
+                s.total_fta,
+                s.total_pts,
+                s.total_min
+            FROM {source} s
+            JOIN players p ON s.player_id = p.id
+            JOIN teams t ON s.team_id = t.id
+            WHERE s.season_id = ?{active_filter}
+            ORDER BY s.pts DESC, s.player_id"""
+
+# Formatted once per (source, active_only) so every call binds the same SQL text.
+_SEASON_STATS_QUERIES = {
+    (source, active_only): _SEASON_STATS_SELECT.format(
+        source=source,
+        active_filter=" AND p.is_active = 1" if active_only else "",
+    )
+    for source in ("player_season_summary", f"({_SEASON_SUMMARY_SELECT})")
+    for active_only in (True, False)
+}
+
+
+def refresh_player_season_summary(season_id: Optional[str] = None) -> int:
+    """Recompute player_season_summary rows from player_games.
 
+    Args:
+        season_id: Season to rebuild; by default every season marked stale
+
+    Returns:
+        Number of seasons rebuilt
+    """
     with get_connection() as conn:
-        rows = conn.execute(query, (season_id,)).fetchall()
-        return [dict(row) for row in rows]
+        if season_id is None:
+            seasons = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT season_id FROM player_season_summary_stale"
+                )
+            ]
+        else:
+            seasons = [season_id]
+        for sid in seasons:
+            _refresh_season_summary(conn, sid)
+        conn.commit()
+    return len(seasons)
+
+
+def _refresh_season_summary(conn: sqlite3.Connection, season_id: str):
+    conn.execute("DELETE FROM player_season_summary WHERE season_id = ?", (season_id,))
+    conn.execute(
+        "INSERT INTO player_season_summary " + _SEASON_SUMMARY_SELECT, (season_id,)
+    )
+    conn.execute(
+        "DELETE FROM player_season_summary_stale WHERE season_id = ?", (season_id,)
+    )
+
+
+def get_all_season_stats(season_id: str, active_only: bool = True) -> List[Dict]:
+    """Get aggregated stats for all players in a season."""
+    return list(iter_all_season_stats(season_id, active_only))
+
+
+def iter_all_season_stats(season_id: str, active_only: bool = True) -> Iterator[Dict]:
+    """Yield aggregated stats for all players in a season, one row at a time.
+
+    Reads player_season_summary, first rebuilding the season if writes have
+    marked it stale. Read-only databases, and callers with a transaction
+    open, aggregate player_games directly instead.
+    """
+    source = "player_season_summary"
+    params: tuple = (season_id,)
+    with get_connection() as conn:
+        stale = conn.execute(
+            "SELECT 1 FROM player_season_summary_stale WHERE season_id = ?",
+            (season_id,),
+        ).fetchone()
+        # Inside the caller's transaction (e.g. a write_batch) the rebuild
+        # would become part of their writes, and rolling back a failed one
+        # would discard them.
+        if stale and not conn.in_transaction:
+            try:
+                _refresh_season_summary(conn, season_id)
+                conn.commit()
+                stale = None
+            except sqlite3.OperationalError:
+                conn.rollback()
+        if stale:
+            source = f"({_SEASON_SUMMARY_SELECT})"
+            params = (season_id, season_id)
+        query = _SEASON_STATS_QUERIES[source, bool(active_only)]
+        yield from _iter_dicts(conn, query, params)
 
 
 def get_game_boxscore(game_id: str) -> Optional[Dict[str, Any]]:
@@ -1086,7 +1804,8 @@ def get_game_boxscore(game_id: str) -> Optional[Dict[str, Any]]:
         if not game:
             return None
 
-        players = conn.execute(
+        players = _iter_dicts(
+            conn,
             """SELECT pg.*, p.name, p.position, t.name as team
                FROM player_games pg
                JOIN players p ON pg.player_id = p.id
@@ -1094,15 +1813,16 @@ def get_game_boxscore(game_id: str) -> Optional[Dict[str, Any]]:
                WHERE pg.game_id = ?
                ORDER BY t.id, pg.minutes DESC""",
             (game_id,),
-        ).fetchall()
+        )
 
-        return {"game": dict(game), "players": [dict(p) for p in players]}
+        return {"game": dict(game), "players": list(players)}
 
 
 def get_games_in_season(season_id: str) -> List[Dict]:
     """Get all games in a season."""
     with get_connection() as conn:
-        rows = conn.execute(
+        rows = _iter_dicts(
+            conn,
             """SELECT g.*,
                       ht.name as home_team_name,
                       at.name as away_team_name
@@ -1112,12 +1832,12 @@ def get_games_in_season(season_id: str) -> List[Dict]:
                WHERE g.season_id = ?
                ORDER BY g.game_date""",
             (season_id,),
-        ).fetchall()
+        )
 
-        return [dict(row) for row in rows]
+        return list(rows)
 
 
-def get_existing_game_ids(season_id: Optional[str] = None) -> set:
+def get_existing_game_ids(season_id: Optional[str] = None) -> FrozenSet[str]:
     """Get set of game IDs already in database that have scores.
 
     Only returns games with non-NULL scores so that future games
@@ -1127,20 +1847,20 @@ def get_existing_game_ids(season_id: Optional[str] = None) -> set:
         season_id: Optional season filter. If None, returns all game IDs.
 
     Returns:
-        Set of game_id strings that exist in the database with scores.
+        Frozen set of game_id strings that exist in the database with scores.
     """
     with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
         if season_id:
-            rows = conn.execute(
+            cursor.execute(
                 "SELECT id FROM games WHERE season_id = ? AND home_score IS NOT NULL",
                 (season_id,),
-            ).fetchall()
+            )
         else:
-            rows = conn.execute(
-                "SELECT id FROM games WHERE home_score IS NOT NULL"
-            ).fetchall()
+            cursor.execute("SELECT id FROM games WHERE home_score IS NOT NULL")
 
-        return {row["id"] for row in rows}
+        return frozenset(game_id for (game_id,) in cursor)
 
 
 def get_last_game_date(season_id: str) -> Optional[str]:
@@ -1160,6 +1880,50 @@ def get_last_game_date(season_id: str) -> Optional[str]:
         return row["last_date"] if row and row["last_date"] else None
 
 
+# Shared by insert_team_standing and bulk_insert_team_standings.
+_UPSERT_TEAM_STANDING_SQL = """INSERT INTO team_standings
+    (season_id, team_id, rank, games_played, wins, losses, win_pct,
+     games_behind, home_wins, home_losses, away_wins, away_losses,
+     streak, last5, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(season_id, team_id) DO UPDATE SET
+      rank = excluded.rank,
+      games_played = excluded.games_played,
+      wins = excluded.wins,
+      losses = excluded.losses,
+      win_pct = excluded.win_pct,
+      games_behind = excluded.games_behind,
+      home_wins = excluded.home_wins,
+      home_losses = excluded.home_losses,
+      away_wins = excluded.away_wins,
+      away_losses = excluded.away_losses,
+      streak = excluded.streak,
+      last5 = excluded.last5,
+      updated_at = excluded.updated_at"""
+
+
+def _team_standing_row(
+    season_id: str, team_id: str, standing: Dict[str, Any], updated_at: str
+) -> tuple:
+    return (
+        season_id,
+        team_id,
+        standing.get("rank", 0),
+        standing.get("games_played", 0),
+        standing.get("wins", 0),
+        standing.get("losses", 0),
+        standing.get("win_pct", 0.0),
+        standing.get("games_behind", 0.0),
+        standing.get("home_wins", 0),
+        standing.get("home_losses", 0),
+        standing.get("away_wins", 0),
+        standing.get("away_losses", 0),
+        standing.get("streak"),
+        standing.get("last5"),
+        updated_at,
+    )
+
+
 def insert_team_standing(season_id: str, team_id: str, standing: Dict[str, Any]):
     """Insert or update a team's standings.
 
@@ -1170,27 +1934,8 @@ def insert_team_standing(season_id: str, team_id: str, standing: Dict[str, Any])
     """
     with get_connection() as conn:
         conn.execute(
-            """INSERT OR REPLACE INTO team_standings
-               (season_id, team_id, rank, games_played, wins, losses, win_pct,
-                games_behind, home_wins, home_losses, away_wins, away_losses,
-                streak, last5, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))""",
-            (
-                season_id,
-                team_id,
-                standing.get("rank", 0),
-                standing.get("games_played", 0),
-                standing.get("wins", 0),
-                standing.get("losses", 0),
-                standing.get("win_pct", 0.0),
-                standing.get("games_behind", 0.0),
-                standing.get("home_wins", 0),
-                standing.get("home_losses", 0),
-                standing.get("away_wins", 0),
-                standing.get("away_losses", 0),
-                standing.get("streak"),
-                standing.get("last5"),
-            ),
+            _UPSERT_TEAM_STANDING_SQL,
+            _team_standing_row(season_id, team_id, standing, _sqlite_now()),
         )
         conn.commit()
 
@@ -1202,31 +1947,16 @@ def bulk_insert_team_standings(season_id: str, standings: List[Dict[str, Any]]):
         season_id: Season code (e.g., '046')
         standings: List of standing dicts with team_id and standing data
     """
+    updated_at = _sqlite_now()
     with get_connection() as conn:
-        for standing in standings:
-            conn.execute(
-                """INSERT OR REPLACE INTO team_standings
-                   (season_id, team_id, rank, games_played, wins, losses, win_pct,
-                    games_behind, home_wins, home_losses, away_wins, away_losses,
-                    streak, last5, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))""",
-                (
-                    season_id,
-                    standing.get("team_id"),
-                    standing.get("rank", 0),
-                    standing.get("games_played", 0),
-                    standing.get("wins", 0),
-                    standing.get("losses", 0),
-                    standing.get("win_pct", 0.0),
-                    standing.get("games_behind", 0.0),
-                    standing.get("home_wins", 0),
-                    standing.get("home_losses", 0),
-                    standing.get("away_wins", 0),
-                    standing.get("away_losses", 0),
-                    standing.get("streak"),
-                    standing.get("last5"),
-                ),
-            )
+        _begin_immediate(conn)
+        conn.executemany(
+            _UPSERT_TEAM_STANDING_SQL,
+            [
+                _team_standing_row(season_id, standing["team_id"], standing, updated_at)
+                for standing in standings
+            ],
+        )
         conn.commit()
         logger.info(f"Inserted {len(standings)} team standings for season {season_id}")
 
@@ -1322,6 +2052,10 @@ def get_team_players(team_id: str, season_id: str) -> List[Dict]:
     Returns:
         List of player dicts with season averages and PIR
     """
+    # Left to itself the planner drives from idx_player_games_team, reading the
+    # team's box scores for every season and discarding other seasons on the
+    # games lookup. CROSS JOIN pins games as the outer table, so only this
+    # season's games are read and each probes (team_id, game_id).
     with get_connection() as conn:
         rows = conn.execute(
             """SELECT
@@ -1335,10 +2069,11 @@ def get_team_players(team_id: str, season_id: str) -> List[Dict]:
                 AVG(pg.tov) as tov,
                 AVG(pg.pts + pg.reb + pg.ast + pg.stl + pg.blk
                     + (pg.fgm - pg.fga) + (pg.ftm - pg.fta) - pg.tov) as pir
-            FROM players p
-            JOIN player_games pg ON p.id = pg.player_id
-            JOIN games g ON pg.game_id = g.id
-            WHERE pg.team_id = ? AND g.season_id = ?
+            FROM games g
+            CROSS JOIN player_games pg
+                ON pg.game_id = g.id AND pg.team_id = ?
+            JOIN players p ON p.id = pg.player_id
+            WHERE g.season_id = ?
             GROUP BY p.id
             HAVING gp > 0
             ORDER BY pir DESC""",
@@ -1410,20 +2145,21 @@ def save_game_predictions(
         promote_latest: whether to upsert game_team_predictions cache row
         generated_at: optional explicit timestamp for deterministic tests
     """
+    created_at = _sqlite_now()
     with get_connection() as conn:
         # Save player predictions
-        for pred in predictions:
-            conn.execute(
-                """INSERT OR REPLACE INTO game_predictions
-                   (game_id, team_id, player_id, is_starter,
-                    predicted_pts, predicted_pts_low, predicted_pts_high,
-                    predicted_reb, predicted_reb_low, predicted_reb_high,
-                    predicted_ast, predicted_ast_low, predicted_ast_high,
-                    predicted_stl, predicted_stl_low, predicted_stl_high,
-                    predicted_blk, predicted_blk_low, predicted_blk_high,
-                    created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                           ?, ?, ?, ?, ?, ?, datetime('now'))""",
+        conn.executemany(
+            """INSERT OR REPLACE INTO game_predictions
+               (game_id, team_id, player_id, is_starter,
+                predicted_pts, predicted_pts_low, predicted_pts_high,
+                predicted_reb, predicted_reb_low, predicted_reb_high,
+                predicted_ast, predicted_ast_low, predicted_ast_high,
+                predicted_stl, predicted_stl_low, predicted_stl_high,
+                predicted_blk, predicted_blk_low, predicted_blk_high,
+                created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                       ?, ?, ?, ?, ?, ?, ?)""",
+            [
                 (
                     game_id,
                     pred.get("team_id"),
@@ -1444,87 +2180,56 @@ def save_game_predictions(
                     pred.get("predicted_blk"),
                     pred.get("predicted_blk_low"),
                     pred.get("predicted_blk_high"),
-                ),
-            )
+                    created_at,
+                )
+                for pred in predictions
+            ],
+        )
 
         # Save team prediction
         if team_prediction:
+            run_at = generated_at or created_at
             # Append run history first.
-            if generated_at:
+            conn.execute(
+                """INSERT INTO game_team_prediction_runs
+                   (game_id, prediction_kind, model_version, generated_at,
+                    home_win_prob, away_win_prob, home_predicted_pts, away_predicted_pts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    game_id,
+                    prediction_kind,
+                    model_version,
+                    run_at,
+                    team_prediction.get("home_win_prob"),
+                    team_prediction.get("away_win_prob"),
+                    team_prediction.get("home_predicted_pts"),
+                    team_prediction.get("away_predicted_pts"),
+                ),
+            )
+
+            # Promote into cache only when requested.
+            if promote_latest:
+                pregame_generated_at = (
+                    generated_at if prediction_kind == "pregame" else None
+                )
                 conn.execute(
-                    """INSERT INTO game_team_prediction_runs
-                       (game_id, prediction_kind, model_version, generated_at,
-                        home_win_prob, away_win_prob, home_predicted_pts, away_predicted_pts)
+                    """INSERT OR REPLACE INTO game_team_predictions
+                       (game_id, home_win_prob, away_win_prob,
+                        home_predicted_pts, away_predicted_pts,
+                        model_version, pregame_generated_at, created_at)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
                     (
                         game_id,
-                        prediction_kind,
-                        model_version,
-                        generated_at,
                         team_prediction.get("home_win_prob"),
                         team_prediction.get("away_win_prob"),
                         team_prediction.get("home_predicted_pts"),
                         team_prediction.get("away_predicted_pts"),
-                    ),
-                )
-            else:
-                conn.execute(
-                    """INSERT INTO game_team_prediction_runs
-                       (game_id, prediction_kind, model_version, generated_at,
-                        home_win_prob, away_win_prob, home_predicted_pts, away_predicted_pts)
-                       VALUES (?, ?, ?, datetime('now'), ?, ?, ?, ?)""",
-                    (
-                        game_id,
-                        prediction_kind,
                         model_version,
-                        team_prediction.get("home_win_prob"),
-                        team_prediction.get("away_win_prob"),
-                        team_prediction.get("home_predicted_pts"),
-                        team_prediction.get("away_predicted_pts"),
+                        pregame_generated_at,
+                        run_at,
                     ),
                 )
 
-            # Promote into cache only when requested.
-            if promote_latest:
-                pregame_generated_at = (
-                    generated_at if prediction_kind == "pregame" else None
-                )
-                if generated_at:
-                    conn.execute(
-                        """INSERT OR REPLACE INTO game_team_predictions
-                           (game_id, home_win_prob, away_win_prob,
-                            home_predicted_pts, away_predicted_pts,
-                            model_version, pregame_generated_at, created_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            game_id,
-                            team_prediction.get("home_win_prob"),
-                            team_prediction.get("away_win_prob"),
-                            team_prediction.get("home_predicted_pts"),
-                            team_prediction.get("away_predicted_pts"),
-                            model_version,
-                            pregame_generated_at,
-                            generated_at,
-                        ),
-                    )
-                else:
-                    conn.execute(
-                        """INSERT OR REPLACE INTO game_team_predictions
-                           (game_id, home_win_prob, away_win_prob,
-                            home_predicted_pts, away_predicted_pts,
-                            model_version, pregame_generated_at, created_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))""",
-                        (
-                            game_id,
-                            team_prediction.get("home_win_prob"),
-                            team_prediction.get("away_win_prob"),
-                            team_prediction.get("home_predicted_pts"),
-                            team_prediction.get("away_predicted_pts"),
-                            model_version,
-                            pregame_generated_at,
-                        ),
-                    )
-
         conn.commit()
         logger.info(f"Saved {len(predictions)} predictions for game {game_id}")
 
@@ -1632,10 +2337,56 @@ def has_game_predictions(game_id: str) -> bool:
     """Check if predictions exist for a game."""
     with get_connection() as conn:
         row = conn.execute(
-            "SELECT COUNT(*) as cnt FROM game_predictions WHERE game_id = ?",
+            "SELECT 1 FROM game_predictions WHERE game_id = ? LIMIT 1",
             (game_id,),
         ).fetchone()
-        return row["cnt"] > 0
+        return row is not None
+
+
+def get_games_with_predictions(game_ids: Iterable[str]) -> FrozenSet[str]:
+    """Return the subset of ``game_ids`` that already have predictions.
+
+    Batch form of :func:`has_game_predictions` for callers that loop over
+    many games; ids are looked up in chunks of ``_MAX_SQL_VARIABLES``.
+    """
+    ids = list(dict.fromkeys(game_ids))
+    found: Set[str] = set()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        for start in range(0, len(ids), _MAX_SQL_VARIABLES):
+            chunk = ids[start : start + _MAX_SQL_VARIABLES]
+            cursor.execute(
+                "SELECT DISTINCT game_id FROM game_predictions "  # nosec B608 — ? list
+                f"WHERE game_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            found.update(game_id for (game_id,) in cursor)
+    return frozenset(found)
+
+
+_UPDATE_QUARTER_SCORES_SQL = """UPDATE games SET
+    home_q1 = ?, home_q2 = ?, home_q3 = ?, home_q4 = ?, home_ot = ?,
+    away_q1 = ?, away_q2 = ?, away_q3 = ?, away_q4 = ?, away_ot = ?,
+    venue = ?
+    WHERE id = ?"""
+
+
+def _quarter_scores_row(game_id: str, data: Dict[str, Any]) -> tuple:
+    return (
+        data.get("home_q1"),
+        data.get("home_q2"),
+        data.get("home_q3"),
+        data.get("home_q4"),
+        data.get("home_ot"),
+        data.get("away_q1"),
+        data.get("away_q2"),
+        data.get("away_q3"),
+        data.get("away_q4"),
+        data.get("away_ot"),
+        data.get("venue"),
+        game_id,
+    )
 
 
 def update_game_quarter_scores(game_id: str, data: Dict[str, Any]):
@@ -1646,27 +2397,7 @@ def update_game_quarter_scores(game_id: str, data: Dict[str, Any]):
         data: Dict with optional keys: home_q1..home_ot, away_q1..away_ot, venue
     """
     with get_connection() as conn:
-        conn.execute(
-            """UPDATE games SET
-                home_q1 = ?, home_q2 = ?, home_q3 = ?, home_q4 = ?, home_ot = ?,
-                away_q1 = ?, away_q2 = ?, away_q3 = ?, away_q4 = ?, away_ot = ?,
-                venue = ?
-               WHERE id = ?""",
-            (
-                data.get("home_q1"),
-                data.get("home_q2"),
-                data.get("home_q3"),
-                data.get("home_q4"),
-                data.get("home_ot"),
-                data.get("away_q1"),
-                data.get("away_q2"),
-                data.get("away_q3"),
-                data.get("away_q4"),
-                data.get("away_ot"),
-                data.get("venue"),
-                game_id,
-            ),
-        )
+        conn.execute(_UPDATE_QUARTER_SCORES_SQL, _quarter_scores_row(game_id, data))
         conn.commit()
 
 
@@ -1677,28 +2408,11 @@ def bulk_update_quarter_scores(records: List[Dict[str, Any]]):
         records: List of dicts with game_id and quarter score data
     """
     with get_connection() as conn:
-        for rec in records:
-            conn.execute(
-                """UPDATE games SET
-                    home_q1 = ?, home_q2 = ?, home_q3 = ?, home_q4 = ?, home_ot = ?,
-                    away_q1 = ?, away_q2 = ?, away_q3 = ?, away_q4 = ?, away_ot = ?,
-                    venue = ?
-                   WHERE id = ?""",
-                (
-                    rec.get("home_q1"),
-                    rec.get("home_q2"),
-                    rec.get("home_q3"),
-                    rec.get("home_q4"),
-                    rec.get("home_ot"),
-                    rec.get("away_q1"),
-                    rec.get("away_q2"),
-                    rec.get("away_q3"),
-                    rec.get("away_q4"),
-                    rec.get("away_ot"),
-                    rec.get("venue"),
-                    rec["game_id"],
-                ),
-            )
+        _begin_immediate(conn)
+        conn.executemany(
+            _UPDATE_QUARTER_SCORES_SQL,
+            [_quarter_scores_row(rec["game_id"], rec) for rec in records],
+        )
         conn.commit()
         logger.info(f"Updated quarter scores for {len(records)} games")
 
@@ -1920,6 +2634,11 @@ def resolve_orphan_players():
         return resolved
 
 
+_PLAY_BY_PLAY_INSERT_HEAD = """INSERT OR REPLACE INTO play_by_play
+    (game_id, event_order, quarter, game_clock, team_id, player_id,
+     event_type, home_score, away_score, description)"""
+
+
 def bulk_insert_play_by_play(game_id: str, events: List[Dict[str, Any]]):
     """Bulk insert play-by-play events for a game.
 
@@ -1927,26 +2646,24 @@ def bulk_insert_play_by_play(game_id: str, events: List[Dict[str, Any]]):
         game_id: Game ID
         events: List of event dicts
     """
+    rows = [
+        (
+            game_id,
+            event.get("event_order"),
+            event.get("quarter"),
+            event.get("game_clock"),
+            event.get("team_id"),
+            event.get("player_id"),
+            event.get("event_type"),
+            event.get("home_score"),
+            event.get("away_score"),
+            event.get("description"),
+        )
+        for event in events
+    ]
     with get_connection() as conn:
-        for event in events:
-            conn.execute(
-                """INSERT OR REPLACE INTO play_by_play
-                   (game_id, event_order, quarter, game_clock, team_id, player_id,
-                    event_type, home_score, away_score, description)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    game_id,
-                    event.get("event_order"),
-                    event.get("quarter"),
-                    event.get("game_clock"),
-                    event.get("team_id"),
-                    event.get("player_id"),
-                    event.get("event_type"),
-                    event.get("home_score"),
-                    event.get("away_score"),
-                    event.get("description"),
-                ),
-            )
+        _begin_immediate(conn)
+        _insert_value_rows(conn, _PLAY_BY_PLAY_INSERT_HEAD, rows)
         conn.commit()
         logger.info(f"Inserted {len(events)} play-by-play events for game {game_id}")
 
@@ -1961,22 +2678,28 @@ def get_play_by_play(game_id: str, quarter: Optional[str] = None) -> List[Dict]:
     Returns:
         List of event dicts ordered by event_order
     """
+    return list(iter_play_by_play(game_id, quarter))
+
+
+def iter_play_by_play(game_id: str, quarter: Optional[str] = None) -> Iterator[Dict]:
+    """Yield play-by-play events for a game without building the full list.
+
+    Same arguments and ordering as :func:`get_play_by_play`.
+    """
+    quarter = quarter or None
     with get_connection() as conn:
-        if quarter:
-            rows = conn.execute(
-                """SELECT * FROM play_by_play
-                   WHERE game_id = ? AND quarter = ?
-                   ORDER BY event_order""",
-                (game_id, quarter),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """SELECT * FROM play_by_play
-                   WHERE game_id = ?
-                   ORDER BY event_order""",
-                (game_id,),
-            ).fetchall()
-        return [dict(row) for row in rows]
+        yield from _iter_dicts(
+            conn,
+            """SELECT * FROM play_by_play
+               WHERE game_id = ? AND (? IS NULL OR quarter = ?)
+               ORDER BY event_order""",
+            (game_id, quarter, quarter),
+        )
+
+
+_SHOT_CHARTS_INSERT_HEAD = """INSERT OR REPLACE INTO shot_charts
+    (game_id, player_id, team_id, quarter, game_minute, game_second,
+     x, y, made, shot_zone)"""
 
 
 def bulk_insert_shot_charts(game_id: str, shots: List[Dict[str, Any]]):
@@ -1986,26 +2709,24 @@ def bulk_insert_shot_charts(game_id: str, shots: List[Dict[str, Any]]):
         game_id: Game ID
         shots: List of shot dicts
     """
+    rows = [
+        (
+            game_id,
+            shot.get("player_id"),
+            shot.get("team_id"),
+            shot.get("quarter"),
+            shot.get("game_minute"),
+            shot.get("game_second"),
+            shot.get("x"),
+            shot.get("y"),
+            shot.get("made"),
+            shot.get("shot_zone"),
+        )
+        for shot in shots
+    ]
     with get_connection() as conn:
-        for shot in shots:
-            conn.execute(
-                """INSERT OR REPLACE INTO shot_charts
-                   (game_id, player_id, team_id, quarter, game_minute, game_second,
-                    x, y, made, shot_zone)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    game_id,
-                    shot.get("player_id"),
-                    shot.get("team_id"),
-                    shot.get("quarter"),
-                    shot.get("game_minute"),
-                    shot.get("game_second"),
-                    shot.get("x"),
-                    shot.get("y"),
-                    shot.get("made"),
-                    shot.get("shot_zone"),
-                ),
-            )
+        _begin_immediate(conn)
+        _insert_value_rows(conn, _SHOT_CHARTS_INSERT_HEAD, rows)
         conn.commit()
         logger.info(f"Inserted {len(shots)} shot chart records for game {game_id}")
 
@@ -2020,22 +2741,23 @@ def get_shot_chart(game_id: str, player_id: Optional[str] = None) -> List[Dict]:
     Returns:
         List of shot dicts
     """
+    return list(iter_shot_chart(game_id, player_id))
+
+
+def iter_shot_chart(game_id: str, player_id: Optional[str] = None) -> Iterator[Dict]:
+    """Yield shot chart rows for a game without building the full list.
+
+    Same arguments and ordering as :func:`get_shot_chart`.
+    """
+    player_id = player_id or None
     with get_connection() as conn:
-        if player_id:
-            rows = conn.execute(
-                """SELECT * FROM shot_charts
-                   WHERE game_id = ? AND player_id = ?
-                   ORDER BY quarter, game_minute, game_second""",
-                (game_id, player_id),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """SELECT * FROM shot_charts
-                   WHERE game_id = ?
-                   ORDER BY quarter, game_minute, game_second""",
-                (game_id,),
-            ).fetchall()
-        return [dict(row) for row in rows]
+        yield from _iter_dicts(
+            conn,
+            """SELECT * FROM shot_charts
+               WHERE game_id = ? AND (? IS NULL OR player_id = ?)
+               ORDER BY quarter, game_minute, game_second""",
+            (game_id, player_id, player_id),
+        )
 
 
 def bulk_insert_team_category_stats(
@@ -2048,13 +2770,21 @@ def bulk_insert_team_category_stats(
         category: Category name (pts, reb, ast, etc.)
         stats: List of team stat dicts
     """
+    updated_at = _sqlite_now()
     with get_connection() as conn:
-        for stat in stats:
-            conn.execute(
-                """INSERT OR REPLACE INTO team_category_stats
-                   (season_id, team_id, category, rank, value, games_played,
-                    extra_values, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))""",
+        _begin_immediate(conn)
+        conn.executemany(
+            """INSERT INTO team_category_stats
+               (season_id, team_id, category, rank, value, games_played,
+                extra_values, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(season_id, team_id, category) DO UPDATE SET
+                 rank = excluded.rank,
+                 value = excluded.value,
+                 games_played = excluded.games_played,
+                 extra_values = excluded.extra_values,
+                 updated_at = excluded.updated_at""",
+            [
                 (
                     season_id,
                     stat.get("team_id"),
@@ -2063,8 +2793,11 @@ def bulk_insert_team_category_stats(
                     stat.get("value"),
                     stat.get("games_played"),
                     stat.get("extra_values"),
-                ),
-            )
+                    updated_at,
+                )
+                for stat in stats
+            ],
+        )
         conn.commit()
         logger.info(
             f"Inserted {len(stats)} team category stats "
@@ -2114,12 +2847,20 @@ def bulk_insert_head_to_head(season_id: str, records: List[Dict[str, Any]]):
         records: List of H2H record dicts
     """
     with get_connection() as conn:
-        for rec in records:
-            conn.execute(
-                """INSERT OR REPLACE INTO head_to_head
-                   (season_id, team1_id, team2_id, game_date, game_number,
-                    venue, team1_scores, team2_scores, total_score, winner_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _begin_immediate(conn)
+        conn.executemany(
+            """INSERT INTO head_to_head
+               (season_id, team1_id, team2_id, game_date, game_number,
+                venue, team1_scores, team2_scores, total_score, winner_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(season_id, team1_id, team2_id, game_date) DO UPDATE SET
+                 game_number = excluded.game_number,
+                 venue = excluded.venue,
+                 team1_scores = excluded.team1_scores,
+                 team2_scores = excluded.team2_scores,
+                 total_score = excluded.total_score,
+                 winner_id = excluded.winner_id""",
+            [
                 (
                     season_id,
                     rec.get("team1_id"),
@@ -2131,8 +2872,10 @@ def bulk_insert_head_to_head(season_id: str, records: List[Dict[str, Any]]):
                     rec.get("team2_scores"),
                     rec.get("total_score"),
                     rec.get("winner_id"),
-                ),
-            )
+                )
+                for rec in records
+            ],
+        )
         conn.commit()
         logger.info(
             f"Inserted {len(records)} head-to-head records for season {season_id}"
@@ -2192,12 +2935,24 @@ def bulk_insert_game_mvp(season_id: str, records: List[Dict[str, Any]]):
         records: List of MVP record dicts
     """
     with get_connection() as conn:
-        for rec in records:
-            conn.execute(
-                """INSERT OR REPLACE INTO game_mvp
-                   (season_id, player_id, team_id, game_date, rank,
-                    evaluation_score, minutes, pts, reb, ast, stl, blk, tov)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _begin_immediate(conn)
+        conn.executemany(
+            """INSERT INTO game_mvp
+               (season_id, player_id, team_id, game_date, rank,
+                evaluation_score, minutes, pts, reb, ast, stl, blk, tov)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(season_id, game_date, rank) DO UPDATE SET
+                 player_id = excluded.player_id,
+                 team_id = excluded.team_id,
+                 evaluation_score = excluded.evaluation_score,
+                 minutes = excluded.minutes,
+                 pts = excluded.pts,
+                 reb = excluded.reb,
+                 ast = excluded.ast,
+                 stl = excluded.stl,
+                 blk = excluded.blk,
+                 tov = excluded.tov""",
+            [
                 (
                     season_id,
                     rec.get("player_id"),
@@ -2212,8 +2967,10 @@ def bulk_insert_game_mvp(season_id: str, records: List[Dict[str, Any]]):
                     rec.get("stl"),
                     rec.get("blk"),
                     rec.get("tov"),
-                ),
-            )
+                )
+                for rec in records
+            ],
+        )
         conn.commit()
         logger.info(f"Inserted {len(records)} game MVP records for season {season_id}")
 
@@ -2255,15 +3012,33 @@ def get_game_mvp(season_id: str, game_date: Optional[str] = None) -> List[Dict]:
 def bulk_insert_position_matchups(game_id: str, records: List[Dict[str, Any]]):
     """Bulk insert position matchup records for a game."""
     with get_connection() as conn:
-        for rec in records:
-            conn.execute(
-                """INSERT OR REPLACE INTO position_matchups
-                   (game_id, position, scope, home_pts, away_pts,
-                    home_tpm, away_tpm, home_reb, away_reb,
-                    home_ast, away_ast, home_stl, away_stl,
-                    home_blk, away_blk, home_eff, away_eff,
-                    home_norm_values, away_norm_values)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _begin_immediate(conn)
+        conn.executemany(
+            """INSERT INTO position_matchups
+               (game_id, position, scope, home_pts, away_pts,
+                home_tpm, away_tpm, home_reb, away_reb,
+                home_ast, away_ast, home_stl, away_stl,
+                home_blk, away_blk, home_eff, away_eff,
+                home_norm_values, away_norm_values)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(game_id, position, scope) DO UPDATE SET
+                 home_pts = excluded.home_pts,
+                 away_pts = excluded.away_pts,
+                 home_tpm = excluded.home_tpm,
+                 away_tpm = excluded.away_tpm,
+                 home_reb = excluded.home_reb,
+                 away_reb = excluded.away_reb,
+                 home_ast = excluded.home_ast,
+                 away_ast = excluded.away_ast,
+                 home_stl = excluded.home_stl,
+                 away_stl = excluded.away_stl,
+                 home_blk = excluded.home_blk,
+                 away_blk = excluded.away_blk,
+                 home_eff = excluded.home_eff,
+                 away_eff = excluded.away_eff,
+                 home_norm_values = excluded.home_norm_values,
+                 away_norm_values = excluded.away_norm_values""",
+            [
                 (
                     game_id,
                     rec.get("position"),
@@ -2284,8 +3059,10 @@ def bulk_insert_position_matchups(game_id: str, records: List[Dict[str, Any]]):
                     rec.get("away_eff"),
                     rec.get("home_norm_values"),
                     rec.get("away_norm_values"),
-                ),
-            )
+                )
+                for rec in records
+            ],
+        )
         conn.commit()
         logger.info(f"Inserted {len(records)} position matchup rows for game {game_id}")
 
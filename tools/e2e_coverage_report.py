@@ -13,6 +13,10 @@ from typing import Any
 
 import yaml  # type: ignore[import-untyped]
 
+# libyaml's C loader parses the matrix ~10x faster; PyYAML wheels built
+# without libyaml only ship the pure-Python one.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 SCENARIO_ID_RE = re.compile(r"\[(E2E-[A-Z0-9]+-\d{3})\]")
 VALID_TIERS = ("required", "recommended", "optional")
 REQUIRED_SCENARIO_FIELDS = {
@@ -97,7 +101,8 @@ def parse_args() -> argparse.Namespace:
 def load_matrix(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"matrix not found: {path}")
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    text = path.read_text(encoding="utf-8")
+    raw = yaml.load(text, Loader=YAML_LOADER) or {}  # nosec B506 — safe loaders only
     scenarios = raw.get("scenarios")
     if not isinstance(scenarios, list):
         raise ValueError("matrix must contain 'scenarios' list")
@@ -116,7 +121,7 @@ def extract_ids_from_test_files(root: Path) -> set[str]:
     found: set[str] = set()
     for file_path in root.glob("e2e/**/*.spec.js"):
         text = file_path.read_text(encoding="utf-8")
-        found.update(match.group(1) for match in SCENARIO_ID_RE.finditer(text))
+        found.update(SCENARIO_ID_RE.findall(text))
     return found
 
 
@@ -124,19 +129,27 @@ def iter_suite_tests(
     suite: dict[str, Any], parent_titles: list[str]
 ) -> list[tuple[str, dict[str, Any]]]:
     tests: list[tuple[str, dict[str, Any]]] = []
-    title = suite.get("title")
-    next_titles = parent_titles + ([title] if title else [])
-
-    for spec in suite.get("specs", []):
-        spec_title = spec.get("title")
-        base_titles = next_titles + ([spec_title] if spec_title else [])
-        for test in spec.get("tests", []):
-            test_title = test.get("title")
-            full_title = " ".join(base_titles + ([test_title] if test_title else []))
-            tests.append((full_title.strip(), test))
-
-    for child in suite.get("suites", []):
-        tests.extend(iter_suite_tests(child, next_titles))
+    # Depth-first with an explicit stack; children are pushed in reverse so the
+    # output keeps Playwright's suite order.
+    stack: list[tuple[dict[str, Any], tuple[str, ...]]] = [
+        (suite, tuple(parent_titles))
+    ]
+    while stack:
+        current, titles = stack.pop()
+        title = current.get("title")
+        if title:
+            titles += (title,)
+
+        for spec in current.get("specs", []):
+            spec_title = spec.get("title")
+            base_title = " ".join(titles + (spec_title,) if spec_title else titles)
+            for test in spec.get("tests", []):
+                test_title = test.get("title")
+                full_title = f"{base_title} {test_title}" if test_title else base_title
+                tests.append((full_title.strip(), test))
+
+        for child in reversed(current.get("suites", [])):
+            stack.append((child, titles))
     return tests
 
 
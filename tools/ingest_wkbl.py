@@ -14,6 +14,7 @@ import os
 import re
 import socket
 import time
+from contextlib import nullcontext
 from html import unescape
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
@@ -44,6 +45,7 @@ from config import (
     TEAM_STANDINGS_URL,
     TIMEOUT,
     USER_AGENT,
+    WKBL_TEAM_BY_CODE,
     WKBL_TEAM_CODES,
     setup_logging,
 )
@@ -1204,7 +1206,7 @@ def parse_play_by_play(html):
     Returns:
         List of event dicts with event_order, quarter, game_clock, etc.
     """
-    from config import EVENT_TYPE_MAP
+    from config import EVENT_TYPE_MATCH_ORDER
 
     events = []
     # Capture full <li> tags including attributes
@@ -1249,9 +1251,9 @@ def parse_play_by_play(html):
         player_name = None
         if description:
             # Try matching each known event type (longest first to avoid partial)
-            for kr_event in sorted(EVENT_TYPE_MAP.keys(), key=len, reverse=True):
+            for kr_event, code in EVENT_TYPE_MATCH_ORDER:
                 if kr_event in description:
-                    event_type = EVENT_TYPE_MAP[kr_event]
+                    event_type = code
                     player_name = description.replace(kr_event, "").strip()
                     break
             if not event_type:
@@ -1290,7 +1292,7 @@ def parse_shot_chart(html):
     Returns:
         List of shot dicts with player_id, x, y, made, quarter, shot_zone, etc.
     """
-    from config import get_shot_zone
+    from config import get_shot_zones
 
     shots = []
 
@@ -1310,7 +1312,6 @@ def parse_shot_chart(html):
     )
     for match in re.finditer(shot_pattern, html, re.S):
         result, player_id, minute, second, quarter, x, y = match.groups()
-        x_f, y_f = float(x), float(y)
         is_home = player_id in home_players if player_id else False
         shots.append(
             {
@@ -1319,14 +1320,19 @@ def parse_shot_chart(html):
                 "quarter": quarter,
                 "game_minute": int(minute),
                 "game_second": int(second),
-                "x": x_f,
-                "y": y_f,
+                "x": float(x),
+                "y": float(y),
                 "made": 1 if result == "shot-suc" else 0,
-                "shot_zone": get_shot_zone(x_f, y_f),
+                "shot_zone": None,  # Classified below in one batch
                 "_is_home": is_home,  # Temporary, for team_id resolution
             }
         )
 
+    # Classify all shot zones in a single pass over the coordinates
+    zones = get_shot_zones([s["x"] for s in shots], [s["y"] for s in shots])
+    for shot, zone in zip(shots, zones):
+        shot["shot_zone"] = zone
+
     return shots
 
 
@@ -1655,8 +1661,7 @@ def parse_team_analysis_json(html):
 
 def _wkbl_team_code_to_id(code):
     """Convert WKBL numeric team code to DB team ID."""
-    code_to_id = {v: k for k, v in WKBL_TEAM_CODES.items()}
-    return code_to_id.get(code)
+    return WKBL_TEAM_BY_CODE.get(code)
 
 
 # --- Fetch functions ---
@@ -2346,6 +2351,17 @@ def _save_to_db(
     logger.info("Initializing database...")
     database.init_db()
 
+    # Group-commit the whole import instead of committing after every row.
+    with database.write_batch():
+        _write_game_records(
+            args, game_records, team_records, active_players, game_items, schedule_info
+        )
+
+
+def _write_game_records(
+    args, game_records, team_records, active_players, game_items, schedule_info
+):
+    """Write season, player, game and box-score rows for ``_save_to_db``."""
     # Extract season code from selected_id (e.g., '04601055' -> '046')
     season_code = args.selected_id[:3] if args.selected_id else "046"
 
@@ -2623,24 +2639,27 @@ def _save_future_games(schedule_info, end_date, season_code):
         return
 
     games_saved = 0
-    for game_id, info in future_games:
-        date = info["date"]
-        formatted_date = f"{date[:4]}-{date[4:6]}-{date[6:8]}" if len(date) == 8 else ""
-        home_team_id = get_team_id(info["home_team"])
-        away_team_id = get_team_id(info["away_team"])
-        game_type = parse_game_type(game_id)
-
-        database.insert_game(
-            game_id=game_id,
-            season_id=season_code,
-            game_date=formatted_date,
-            home_team_id=home_team_id,
-            away_team_id=away_team_id,
-            home_score=None,  # Future game - no score
-            away_score=None,
-            game_type=game_type,
-        )
-        games_saved += 1
+    with database.write_batch():
+        for game_id, info in future_games:
+            date = info["date"]
+            formatted_date = (
+                f"{date[:4]}-{date[4:6]}-{date[6:8]}" if len(date) == 8 else ""
+            )
+            home_team_id = get_team_id(info["home_team"])
+            away_team_id = get_team_id(info["away_team"])
+            game_type = parse_game_type(game_id)
+
+            database.insert_game(
+                game_id=game_id,
+                season_id=season_code,
+                game_date=formatted_date,
+                home_team_id=home_team_id,
+                away_team_id=away_team_id,
+                home_score=None,  # Future game - no score
+                away_score=None,
+                game_type=game_type,
+            )
+            games_saved += 1
 
     logger.info(f"Saved {games_saved} future (scheduled) games to database")
 
@@ -2938,18 +2957,19 @@ def _generate_predictions_for_game_ids(game_ids):
 
     # Group by season for efficient context loading
     season_cache = {}
+    predicted = database.get_games_with_predictions(game_ids)
 
     for game_id in game_ids:
+        if game_id in predicted:
+            logger.info(f"Predictions already exist for game {game_id}, skipping")
+            continue
+
         boxscore = database.get_game_boxscore(game_id)
         if not boxscore:
             logger.warning(f"Game not found in database: {game_id}")
             continue
         game = boxscore["game"]
 
-        if database.has_game_predictions(game_id):
-            logger.info(f"Predictions already exist for game {game_id}, skipping")
-            continue
-
         season_code = game["season_id"]
 
         # Cache season-level data
@@ -2971,7 +2991,7 @@ def _generate_predictions_for_game_ids(game_ids):
             sc["team_totals"],
             sc["opp_totals"],
             sc["league_totals"],
-            force_refresh=False,
+            force_refresh=True,  # already filtered by get_games_with_predictions
             prediction_kind="backfill",
             promote_latest=False,
             model_params=model_params,
@@ -3391,19 +3411,20 @@ def _ingest_multiple_seasons(args):
     if args.save_db:
         database.init_db()
 
-    # Process each season
+    # Process each season; a rebuild can be re-run, so relax fsyncs meanwhile.
     total_games = 0
-    for season_code in sorted(season_codes):
-        season_label = SEASON_CODES[season_code]
-        try:
-            records, team_records, game_items = _ingest_single_season(
-                args, season_code, season_label, active_players, game_types
-            )
-            total_games += len(game_items)
-            logger.info(f"Completed {season_label}: {len(game_items)} new games")
-        except Exception as e:
-            logger.error(f"Failed to process season {season_label}: {e}")
-            continue
+    with database.bulk_load() if args.save_db else nullcontext():
+        for season_code in sorted(season_codes):
+            season_label = SEASON_CODES[season_code]
+            try:
+                records, team_records, game_items = _ingest_single_season(
+                    args, season_code, season_label, active_players, game_types
+                )
+                total_games += len(game_items)
+                logger.info(f"Completed {season_label}: {len(game_items)} new games")
+            except Exception as e:
+                logger.error(f"Failed to process season {season_label}: {e}")
+                continue
 
     logger.info(
         f"Multi-season ingest complete: {total_games} total new games across {len(season_codes)} seasons"
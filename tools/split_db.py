@@ -7,7 +7,6 @@ are only needed on game detail pages.
 
 import argparse
 import os
-import shutil
 import sqlite3
 
 # Tables that go into the detail database (large, per-event data)
@@ -28,13 +27,24 @@ def split_database(src_path: str, core_path: str, detail_path: str) -> dict:
     if not os.path.exists(src_path):
         raise FileNotFoundError(f"Source database not found: {src_path}")
 
-    # Get all user table names from source
     src_conn = sqlite3.connect(src_path)
-    cursor = src_conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
-    )
-    all_tables = [row[0] for row in cursor.fetchall()]
-    src_conn.close()
+    try:
+        # The source is published as well (sql.js reads it as a fallback), so
+        # fold any WAL back into it. This fails while another process, e.g. a
+        # running API server, still has the file open.
+        try:
+            src_conn.execute("PRAGMA journal_mode=DELETE")
+        except sqlite3.OperationalError as exc:
+            raise RuntimeError(
+                f"{src_path} is still open in another process (e.g. the API "
+                "server), so its WAL cannot be folded back; close it and retry"
+            ) from exc
+        cursor = src_conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+        all_tables = [row[0] for row in cursor.fetchall()]
+    finally:
+        src_conn.close()
 
     core_tables = [t for t in all_tables if t not in DETAIL_TABLES]
     detail_tables = [t for t in all_tables if t in DETAIL_TABLES]
@@ -58,9 +68,14 @@ def _copy_tables(src_path: str, dst_path: str, tables: list[str]) -> None:
     if os.path.exists(dst_path):
         os.remove(dst_path)
 
-    shutil.copy2(src_path, dst_path)
-
+    # The backup API reads through SQLite, so it sees committed rows even if
+    # some are still only in the source's WAL.
+    src_conn = sqlite3.connect(src_path)
     conn = sqlite3.connect(dst_path)
+    try:
+        src_conn.backup(conn)
+    finally:
+        src_conn.close()
     cursor = conn.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
     )
@@ -72,6 +87,8 @@ def _copy_tables(src_path: str, dst_path: str, tables: list[str]) -> None:
 
     conn.execute("VACUUM")
     conn.commit()
+    # sql.js loads these files on their own, so they must not be in WAL mode.
+    conn.execute("PRAGMA journal_mode=DELETE")
     conn.close()
 
 